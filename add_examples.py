@@ -1,19 +1,11 @@
-import requests
 from datetime import datetime
-import time
 
-NOTION_TOKEN = "os.environ.get("NOTION_TOKEN")"
-DATABASE_ID = "3129979fd60d81cc8e99cb28f8f8c5e1"
+from notion_api import notion
 
-headers = {
-    "Authorization": f"Bearer {NOTION_TOKEN}",
-    "Content-Type": "application/json",
-    "Notion-Version": "2022-06-28"
-}
+DATABASE_ID = "3129979fd60d81cc8e99cb28f8f8c5e1"
 
-def add_patch(title, category, version, content, status="✅ 배포 완료"):
-    url = "https://api.notion.com/v1/pages"
-    data = {
+def patch_payload(title, category, version, content, status="✅ 배포 완료"):
+    return {
         "parent": { "database_id": DATABASE_ID },
         "properties": {
             "제목": { "title": [{ "text": { "content": title } }] },
@@ -37,7 +29,10 @@ def add_patch(title, category, version, content, status="✅ 배포 완료"):
             }
         ]
     }
-    requests.post(url, headers=headers, json=data)
+
+
+def add_patch(title, category, version, content, status="✅ 배포 완료"):
+    return notion.post("/pages", patch_payload(title, category, version, content, status))
 
 if __name__ == "__main__":
     patches = [
@@ -45,7 +40,8 @@ if __name__ == "__main__":
         ("AI 응답 속도 최적화 (기존 대비 2배 향상)", "🛠️ 기능 개선", "v2.1.1", "대규모 언어 모델(LLM) 파이프라인 최적화를 통해 답변 속도가 약 50% 단축되었습니다."),
         ("모바일 웹 브라우저 레이아웃 깨짐 현상 수정", "🐛 버그 수정", "v2.1.2", "아이폰 및 안드로이드 환경에서 버튼이 겹쳐 보이던 현상을 수정하였습니다.")
     ]
-    for p in patches:
-        add_patch(p[0], p[1], p[2], p[3])
-        time.sleep(0.5)
-    print("🎉 모든 예시 데이터가 노션에 반영되었습니다!")
+    created, failures = notion.create_pages([patch_payload(*p) for p in patches], "예시 등록")
+    for p, e in failures:
+        print(f"❌ 등록 실패: {p['properties']['제목']['title'][0]['text']['content']} ({e})")
+    print(f"🎉 예시 데이터 {len(created)}건이 노션에 반영되었습니다!")
+    print(notion.summary())
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+# 빌드 단계별 오프라인 벤치마크.
+# benchmarks/fixtures/ 의 7개 소스 목록 픽스처(+상세페이지)를 get/post_text/read_detail_text 대신 돌려주고
+# 1x / 10x / 100x 로 행을 늘려 가며 단계마다 처리량(rows/s, bytes/s)과 최대 메모리(tracemalloc)를 잰다.
+# 결과는 JSON 으로 저장하고 --baseline 을 주면 단계별 소요 시간을 비교한다.
+#   python3 benchmarks/bench_build.py [--scales 1,10,100] [--out bench.json] [--baseline old.json]
+#   (100x 는 cluster_near_duplicates 때문에 수 분 걸린다. 빠르게 볼 때는 --scales 1,10)
+import argparse, copy, json, platform, random, re, subprocess, sys, tempfile, time, tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parent))
+import build_notices as bn  # noqa: E402
+
+FIXTURES = HERE / "fixtures"
+# 소스별 1x 파싱 결과(main 에서 채움). 후처리 단계 입력과 HTML 소스의 입력 행 수 기준
+BASE_NOTICES = {}
+
+# 소스 -> (픽스처, URL 판별 문자열, 배율을 올릴 때 쓰는 id 치환)
+SOURCES = {
+    "kstartup": ("kstartup.html", "k-startup.go.kr", (r"go_view\((\d+)\)", r"go_view(\g<1>{c:03d})")),
+    "bizinfo": ("bizinfo.html", "bizinfo.go.kr", (r"PBLN_(\d+)", r"PBLN_\g<1>{c:03d}")),
+    "iris": ("iris.json", "iris.go.kr", ("listBsnsAncm", "ancmId")),
+    "egbiz": ("egbiz.json", "egbiz.or.kr", ("value", "bizCyclId")),
+    "smtech": ("smtech.html", "smtech.go.kr", (r"ancmId=S(\d+)", r"ancmId=S\g<1>x{c}")),
+    "smes24": ("smes24.html", "smes.go.kr", (r"PBLN_(\d+)", r"PBLN_\g<1>{c:03d}")),
+    "gosims": ("gosims.json", "bojo.go.kr", ("ntbdList", "nttId")),
+}
+
+
+def scale_html(text: str, k: int, pattern: str, repl: str) -> str:
+    # 본문(<div id="content">...</div><footer>) 을 k 번 이어 붙이고 사본마다 id 를 바꾼다
+    head, rest = text.split('<div id="content">', 1)
+    body, tail = rest.split("</div><footer>", 1)
+    copies = [body] + [re.sub(pattern, repl.format(c=c), body) for c in range(1, k)]
+    return head + '<div id="content">' + "".join(copies) + "</div><footer>" + tail
+
+
+def scale_json(text: str, k: int, list_key: str, id_key: str) -> str:
+    obj = json.loads(text)
+    rows = obj[list_key]
+    out = list(rows)
+    for c in range(1, k):
+        for r in rows:
+            r = dict(r)
+            r[id_key] = f"{r[id_key]}{c:03d}"
+            out.append(r)
+    obj[list_key] = out
+    return json.dumps(obj, ensure_ascii=False)
+
+
+def load_inputs(k: int) -> dict:
+    pages = {}
+    for name, (fname, _, (a, b)) in SOURCES.items():
+        text = (FIXTURES / fname).read_text(encoding="utf-8")
+        if k > 1:
+            text = scale_json(text, k, a, b) if fname.endswith(".json") else scale_html(text, k, a, b)
+        pages[name] = text.encode("utf-8")
+    return pages
+
+
+class FixtureResponse:
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def iter_content(self, size: int = 16384):
+        for i in range(0, len(self.body), size):
+            yield self.body[i:i + size]
+
+
+class Offline:
+    """bn.get / bn.post_text / bn.read_detail_text 를 픽스처로 바꾸고 돌려준 바이트 수를 센다."""
+
+    def __init__(self, pages: dict, detail: bytes):
+        self.pages = pages
+        self.detail = detail
+        self.bytes = 0
+
+    def lookup(self, url: str) -> bytes:
+        for name, (_, host, _) in SOURCES.items():
+            if host in url:
+                return self.pages[name]
+        raise KeyError(url)
+
+    def get(self, url, ttl=None):
+        body = self.lookup(url)
+        self.bytes += len(body)
+        return body.decode("utf-8")
+
+    def post_text(self, url, data, extra_headers=None, ttl=None):
+        return self.get(url)
+
+    def read_detail_text(self, url, ttl=None):
+        # 실제와 같이 조각 단위로 파싱하고, 금액이 확정되면 멈춘다(읽은 만큼만 센다)
+        r = FixtureResponse(self.detail)
+        read = []
+        orig = r.iter_content
+
+        def counted(size=16384):
+            for chunk in orig(size):
+                read.append(len(chunk))
+                yield chunk
+
+        r.iter_content = counted
+        text = bn.read_detail_stream(r)
+        self.bytes += sum(read)
+        return text
+
+    def install(self):
+        # 호스트별 요청 간격(politeness delay)은 네트워크용이라 끈다
+        bn.HOST_DELAY = 0.0
+        bn._gates.clear()
+        bn.get = self.get
+        bn.post_text = self.post_text
+        bn.read_detail_text = self.read_detail_text
+
+
+def measure(fn, repeat: int, setup=None):
+    """(최소 소요 시간, 결과, 최대 메모리). 메모리는 tracemalloc 을 켠 별도 1회 실행으로 잰다."""
+    best = None
+    result = None
+    for _ in range(repeat):
+        arg = setup() if setup else None
+        t0 = time.perf_counter()
+        result = fn(arg) if setup else fn()
+        dt = time.perf_counter() - t0
+        best = dt if best is None else min(best, dt)
+    arg = setup() if setup else None
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    fn(arg) if setup else fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, result, peak
+
+
+def row(scale, stage, rows, nbytes, seconds, peak):
+    return {
+        "scale": scale,
+        "stage": stage,
+        "rows": rows,
+        "bytes": nbytes,
+        "seconds": round(seconds, 6),
+        "rowsPerSec": round(rows / seconds, 1) if seconds else None,
+        "bytesPerSec": round(nbytes / seconds, 1) if seconds and nbytes else None,
+        "peakMemBytes": peak,
+    }
+
+
+# 복제본 제목용 어휘. 사본 제목을 원본과 다른 낱말 조합으로 만들어야 near-dup 후보가 실제 데이터처럼 드물다
+TITLE_WORDS = (
+    "스마트 제조 혁신 바우처 청년 창업 사관학교 글로벌 진출 수출 판로 개척 디지털 전환 탄소중립 녹색 "
+    "기술 개발 사업화 지원 소상공인 전통시장 온라인 플랫폼 입점 해외 전시회 컨설팅 인증 특허 출원 "
+    "연구 장비 공동 활용 지역 특화 산업 육성 일자리 채용 장려금 여성 기업 재도전 폐업 재기 "
+    "관광 콘텐츠 문화 예술 농식품 수산 바이오 헬스 반도체 소재 부품 로봇 드론 인공지능 데이터"
+).split()
+
+
+def scale_notices(notices: list, k: int) -> list:
+    # 후처리 단계용: 1x 결과를 k 벌로 복제(사본마다 id/제목을 바꿔 중복 제거에 다 걸리지 않게)
+    rng = random.Random(k)
+    out = copy.deepcopy(notices)
+    for c in range(1, k):
+        for n in notices:
+            m = dict(n)
+            m["id"] = f"{n['id']}-{c}"
+            m["title"] = f"2026년 {' '.join(rng.sample(TITLE_WORDS, 5))} 공고 ({c}차)"
+            if m.get("url"):
+                m["url"] = f"{n['url']}&copy={c}"
+            out.append(m)
+    return out
+
+
+def bench_scale(k: int, repeat: int, tmp: Path) -> list:
+    pages = load_inputs(k)
+    detail = (FIXTURES / "detail.html").read_bytes()
+    off = Offline(pages, detail)
+    off.install()
+    results = []
+
+    # 1) 소스별 파싱(+ kstartup/bizinfo 는 상세페이지 지원금 추출까지)
+    for name, fn, *_ in bn.SOURCES:
+        rows_in = len(json.loads(pages[name])[SOURCES[name][2][0]]) if SOURCES[name][0].endswith(".json") else None
+
+        def setup():
+            bn.PREVIOUS = {}
+            off.bytes = 0
+
+        seconds, _, peak = measure(lambda _: fn(), repeat, setup)
+        if rows_in is None:
+            rows_in = k * len(BASE_NOTICES[name])
+        results.append(row(k, f"source:{name}", rows_in, off.bytes, seconds, peak))
+
+    # 2) 단계별 후처리. 입력은 1x 파싱 결과를 k 벌 복제한 목록
+    notices = scale_notices([n for name in BASE_NOTICES for n in BASE_NOTICES[name]], k)
+    titles = [n["title"] for n in notices]
+    detail_text = bn.DetailText()
+    detail_text.feed(detail.decode("utf-8"))
+    texts = [detail_text.text()] * min(len(notices), 200 * k)
+
+    stages = [
+        ("clean", lambda _: [bn.clean(t) for t in titles], len(titles), sum(len(t.encode()) for t in titles)),
+        ("normalize_title", lambda _: [bn.normalize_title(t) for t in titles], len(titles), sum(len(t.encode()) for t in titles)),
+        ("extract_support_amount", lambda _: [bn.extract_support_amount(t) for t in texts], len(texts), sum(len(t.encode()) for t in texts)),
+        ("dedupe_notices", lambda ns: bn.dedupe_notices(ns), len(notices), 0),
+        ("cluster_near_duplicates", lambda ns: bn.cluster_near_duplicates(ns), len(notices), 0),
+        ("sort", lambda ns: ns.sort(key=bn.sort_key), len(notices), 0),
+        ("attach_match_features", lambda ns: bn.attach_match_features(ns), len(notices), 0),
+        ("build_search_index", lambda ns: bn.build_search_index(ns), len(notices), 0),
+        ("encode_columnar", lambda ns: bn.encode_columnar(ns), len(notices), 0),
+    ]
+    for stage, fn, rows, nbytes in stages:
+        seconds, _, peak = measure(fn, repeat, lambda: copy.deepcopy(notices))
+        results.append(row(k, stage, rows, nbytes, seconds, peak))
+
+    # 3) 산출물 쓰기(임시 폴더)
+    bn.BASE = tmp
+    bn.DATA_DIR = tmp / "data"
+    meta = {"updatedAt": "bench", "count": len(notices)}
+    for compact in (False, True):
+        seconds, _, peak = measure(lambda ns: bn.write_outputs(meta, ns, compact=compact), repeat, lambda: copy.deepcopy(notices))
+        written = sum(p.stat().st_size for p in tmp.rglob("*") if p.is_file())
+        results.append(row(k, "write_outputs" + (":compact" if compact else ""), len(notices), written, seconds, peak))
+    return results
+
+
+def git_rev() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=HERE, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def compare(results: list, baseline_path: str):
+    base = json.loads(Path(baseline_path).read_text(encoding="utf-8"))
+    old = {(r["scale"], r["stage"]): r for r in base["results"]}
+    print(f"\nvs {baseline_path} ({base.get('meta', {}).get('commit', '?')})")
+    print(f"{'stage':<34}{'old ms':>10}{'new ms':>10}{'change':>9}{'mem':>9}")
+    for r in results:
+        o = old.get((r["scale"], r["stage"]))
+        if not o:
+            continue
+        change = (r["seconds"] / o["seconds"] - 1) * 100 if o["seconds"] else 0
+        mem = (r["peakMemBytes"] / o["peakMemBytes"] - 1) * 100 if o["peakMemBytes"] else 0
+        print(f"{str(r['scale']) + 'x ' + r['stage']:<34}{o['seconds'] * 1000:>10.1f}{r['seconds'] * 1000:>10.1f}{change:>+8.0f}%{mem:>+8.0f}%")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="빌드 단계별 오프라인 벤치마크")
+    ap.add_argument("--scales", default="1,10,100")
+    ap.add_argument("--repeat", type=int, default=3, help="단계마다 반복 횟수(최솟값 사용)")
+    ap.add_argument("--out", default="", help="결과 JSON 경로(기본: 표준 출력에 표만)")
+    ap.add_argument("--baseline", default="", help="비교할 이전 결과 JSON")
+    args = ap.parse_args()
+    scales = [int(x) for x in args.scales.split(",")]
+
+    Offline(load_inputs(1), (FIXTURES / "detail.html").read_bytes()).install()
+    for name, fn, *_ in bn.SOURCES:
+        bn.PREVIOUS = {}
+        BASE_NOTICES[name] = fn()
+
+    results = []
+    print(f"{'stage':<34}{'rows':>8}{'ms':>10}{'rows/s':>12}{'MB/s':>8}{'peak MB':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for k in scales:
+            for r in bench_scale(k, args.repeat if k < 100 else 1, Path(tmp)):
+                results.append(r)
+                mbs = f"{r['bytesPerSec'] / 1e6:.1f}" if r["bytesPerSec"] else "-"
+                print(f"{str(k) + 'x ' + r['stage']:<34}{r['rows']:>8}{r['seconds'] * 1000:>10.1f}"
+                      f"{r['rowsPerSec'] or 0:>12,.0f}{mbs:>8}{r['peakMemBytes'] / 1e6:>9.1f}")
+
+    report = {
+        "meta": {
+            "commit": git_rev(),
+            "createdAt": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "scales": scales,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    if args.out:
+        Path(args.out).write_text(json.dumps(report, ensure_ascii=False, indent=1) + "\n", encoding="utf-8")
+        print(f"\nsaved {args.out}")
+    if args.baseline:
+        compare(results, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
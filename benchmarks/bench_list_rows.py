@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# 목록 페이지 행 추출 벤치마크: 기존 정규식 스캔 vs iter_rows/iter_*_cards 단일 스캔
+# 합성 페이지 크기를 늘려 가며 행당 처리 시간이 일정한지(선형인지) 확인한다.
+#   python3 benchmarks/bench_list_rows.py [--sizes 100,300,1000,3000]
+import argparse, re, sys, time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import build_notices as bn  # noqa: E402
+
+KSTARTUP_LEGACY = re.compile(
+    r"go_view\((\d+)\).*?"
+    r"<span class=\"flag type\d+\">\s*([^<]+?)\s*</span>.*?"
+    r"<span class=\"flag day\">\s*D-(\d+)\s*</span>.*?"
+    r"마감일자\s*([0-9\-]{10}).*?"
+    r"<p class=\"tit\">\s*(.*?)\s*</p>",
+    re.S,
+)
+
+
+def kstartup_page(n: int) -> str:
+    cards = []
+    for i in range(n):
+        cards.append(
+            f'<li class="notice"><a href="javascript:go_view({100000 + i});">bm</a>'
+            f'<span class="flag type0{i % 9 + 1}">사업화</span><span class="flag day">D-{i % 30}</span>'
+            f'<span class="list">마감일자 2026-03-{10 + i % 18}</span>'
+            f'<p class="tit">[서울] 2026년 창업 지원 {i}호 공고</p></li>'
+            # 모집 대상이 없는 카드(정규식은 다음 카드까지 되짚어 탐색)
+            f'<li class="ad"><a href="javascript:go_view({900000 + i});">광고</a></li>'
+        )
+    return "<ul>" + "\n".join(cards) + "</ul>"
+
+
+def kstartup_drift_page(n: int) -> str:
+    # 마크업이 바뀌어 D-day flag 가 사라진 경우: 정규식은 go_view 마다 문서 끝까지 되짚는다.
+    return kstartup_page(n).replace('class="flag day"', 'class="flag dday"')
+
+
+def bizinfo_page(n: int) -> str:
+    rows = []
+    for i in range(n):
+        rows.append(
+            f'<tr><td>{i}</td><td>수출</td><td><a href="/sii/siia/selectSIIA200Detail.do?pblancId=PBLN_{i:015d}">공고 {i}</a></td>'
+            f"<td>2026-02-23 ~ 2026-03-{10 + i % 18}</td><td>충남</td><td>기관</td><td>2026-02-24</td><td>1</td></tr>"
+        )
+    return "<table><tbody>" + "\n".join(rows) + "</tbody></table>"
+
+
+def legacy_kstartup(txt: str) -> int:
+    return sum(1 for _ in KSTARTUP_LEGACY.finditer(txt))
+
+
+def legacy_bizinfo(txt: str) -> int:
+    n = 0
+    for row in re.findall(r"<tr>.*?</tr>", txt, flags=re.S):
+        if "pblancId=PBLN_" in row and len(re.findall(r"<td[^>]*>(.*?)</td>", row, flags=re.S)) >= 7:
+            n += 1
+    return n
+
+
+def single_pass_kstartup(txt: str) -> int:
+    return sum(1 for _ in bn.iter_kstartup_cards(txt))
+
+
+def single_pass_bizinfo(txt: str) -> int:
+    return sum(1 for row in bn.iter_rows(txt) if len(row.cells) >= 7)
+
+
+def timed(fn, txt: str, repeat: int = 3):
+    best = None
+    rows = 0
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        rows = fn(txt)
+        dt = time.perf_counter() - t0
+        best = dt if best is None else min(best, dt)
+    return rows, best
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", default="100,300,1000,3000")
+    ap.add_argument("--drift-limit", type=int, default=100, help="drift 케이스에서 정규식을 돌릴 최대 카드 수(이차 시간)")
+    args = ap.parse_args()
+    sizes = [int(x) for x in args.sizes.split(",")]
+
+    # us/row 는 입력 행(카드) 수 기준
+    print(f"{'case':<28}{'rows':>8}{'KB':>9}{'ms':>10}{'us/row':>10}")
+    for name, page, impls in [
+        ("kstartup", kstartup_page, [("regex", legacy_kstartup), ("single-pass", single_pass_kstartup)]),
+        ("kstartup-drift", kstartup_drift_page, [("regex", legacy_kstartup), ("single-pass", single_pass_kstartup)]),
+        ("bizinfo", bizinfo_page, [("regex", legacy_bizinfo), ("single-pass", single_pass_bizinfo)]),
+    ]:
+        for n in sizes:
+            txt = page(n)
+            for label, fn in impls:
+                if name.endswith("drift") and label == "regex" and n > args.drift_limit:
+                    continue
+                rows, dt = timed(fn, txt)
+                print(f"{name + '/' + label:<28}{rows:>8}{len(txt) // 1024:>9}{dt * 1000:>10.1f}{dt * 1e6 / n:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
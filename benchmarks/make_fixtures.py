@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# bench_build.py 가 쓰는 소스별 목록/상세 픽스처(benchmarks/fixtures/)를 만든다.
+# 각 포털 마크업/JSON 구조를 파서가 기대하는 모양 그대로 흉내 낸 고정 데이터(시드 고정)라
+# 다시 만들어도 같은 파일이 나온다. 파서가 바뀌어 픽스처도 바꿔야 할 때만 다시 실행한다.
+#   python3 benchmarks/make_fixtures.py
+import json, random
+from datetime import date, timedelta
+from pathlib import Path
+
+OUT = Path(__file__).resolve().parent / "fixtures"
+ROWS = 40
+# 마감일은 고정 날짜 기준(오늘 기준이면 dday 분포가 날마다 달라진다)
+BASE_DAY = date(2026, 3, 2)
+
+REGIONS = ["서울", "경기", "부산", "충남", "전북", "강원", "대구", "제주"]
+PROGRAMS = [
+    "{y}년 예비창업패키지 예비창업자 모집 공고",
+    "{y}년 초기창업패키지 창업기업 모집",
+    "{y}년 창업도약패키지 (성장단계) 지원사업 공고",
+    "{r} 중소기업 수출바우처 지원사업 참여기업 모집",
+    "{r} 소상공인 정책자금 융자 지원 안내",
+    "{y}년 스마트공장 구축 지원사업 공고",
+    "{r} 해외전시회 단체참가 지원 기업 모집",
+    "{y}년 TIPS 창업사업화 지원 과제 공고",
+    "{r} 기술혁신개발사업 시장확대형 과제 공고",
+    "{y}년 청년창업사관학교 입교생 모집",
+    "{r} 디자인 개발 지원사업 수혜기업 모집(재공고)",
+    "{y}년 R&D 기획역량 강화 지원사업 공고",
+]
+CATEGORIES = ["사업화", "기술개발", "수출", "금융", "인력", "창업", "내수", "경영"]
+ORGS = ["중소벤처기업부", "창업진흥원", "정보통신산업진흥원", "한국산업기술진흥원", "지역신용보증재단", "테크노파크"]
+
+
+def titles(rng, n):
+    out = []
+    for i in range(n):
+        t = rng.choice(PROGRAMS).format(y=2026, r=f"[{rng.choice(REGIONS)}]")
+        # 일부는 회차 번호를 붙여 서로 다른 공고로, 일부는 그대로 두어 소스 간 중복이 생기게 한다
+        if i % 3:
+            t += f" ({i}차)"
+        out.append(t)
+    return out
+
+
+def day(rng, lo=-3, hi=60):
+    return BASE_DAY + timedelta(days=rng.randint(lo, hi))
+
+
+def page(body, title):
+    # 실제 포털처럼 헤더/메뉴/스크립트가 섞인 껍데기
+    menu = "".join(f'<li><a href="/menu/{i}.do">메뉴 {i}</a></li>' for i in range(30))
+    script = "var gnb = " + json.dumps({"items": list(range(200))}) + ";"
+    return (
+        f'<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8"><title>{title}</title>'
+        f'<script>{script}</script><style>.tit{{font-weight:bold}}</style></head>'
+        f'<body><header><nav><ul>{menu}</ul></nav></header><div id="content">{body}</div>'
+        f'<footer>Copyright (c) {title}</footer></body></html>\n'
+    )
+
+
+def kstartup(rng):
+    cards = []
+    for i, t in enumerate(titles(rng, ROWS)):
+        dl = day(rng, 0)
+        cards.append(
+            f'<li class="notice"><div class="top"><a href="javascript:go_view({170000 + i});" class="bm">북마크</a>'
+            f'<span class="flag type0{i % 9 + 1}">{rng.choice(CATEGORIES)}</span>'
+            f'<span class="flag day">D-{(dl - BASE_DAY).days}</span></div>'
+            f'<div class="middle"><span class="list">마감일자 {dl.isoformat()}</span>'
+            f'<span class="list">조회 {rng.randint(10, 9000)}</span>'
+            f'<p class="tit">{t}</p></div></li>'
+        )
+    return page('<ul class="notice_list">' + "\n".join(cards) + "</ul>", "K-Startup")
+
+
+def bizinfo(rng):
+    rows = []
+    for i, t in enumerate(titles(rng, ROWS)):
+        start = day(rng, -20, 0)
+        dl = day(rng, 0)
+        rows.append(
+            f'<tr><td>{ROWS - i}</td><td>{rng.choice(CATEGORIES)}</td>'
+            f'<td class="txt_l"><a href="/sii/siia/selectSIIA200Detail.do?hashCode=&amp;rows=15&amp;pblancId=PBLN_{118000 + i:015d}" title="{t}">{t}</a></td>'
+            f'<td>{start.isoformat()} ~ {dl.isoformat()}</td><td>{rng.choice(REGIONS)}</td><td>{rng.choice(ORGS)}</td>'
+            f'<td>{start.isoformat()}</td><td>{rng.randint(1, 900)}</td></tr>'
+        )
+    thead = "<thead><tr>" + "".join(f"<th>{h}</th>" for h in ("번호", "분야", "제목", "기간", "지역", "기관", "등록일", "조회")) + "</tr></thead>"
+    return page(f'<table class="table_list">{thead}<tbody>' + "\n".join(rows) + "</tbody></table>", "기업마당")
+
+
+def iris(rng):
+    items = []
+    for i, t in enumerate(titles(rng, ROWS)):
+        start = day(rng, -20, 0)
+        dl = day(rng, 0)
+        items.append({
+            "ancmId": f"{23000 + i:06d}",
+            "ancmTl": t.replace("[", "").replace("]", ""),
+            "rcveStrDe": start.strftime("%Y.%m.%d"),
+            "rcveEndDe": dl.strftime("%Y.%m.%d"),
+            "dDay": str((dl - BASE_DAY).days),
+            "rcveStt": "진행중" if i % 5 else "예정",
+            "blngGovdSe": "과학기술정보통신부" if i % 2 else "산업통상자원부",
+            "sorgnNm": rng.choice(ORGS),
+            "ancmDe": start.strftime("%Y.%m.%d"),
+        })
+    return json.dumps({"listBsnsAncm": items, "bsnsAncmPaginationInfo": {"totalPageCount": 1, "currentPageNo": 1}}, ensure_ascii=False)
+
+
+def egbiz(rng):
+    items = []
+    for i, t in enumerate(titles(rng, ROWS)):
+        start = day(rng, -20, 0)
+        dl = day(rng, 0)
+        items.append({
+            "bizCyclId": f"BC{2026000 + i}",
+            "bizNm": t,
+            "aplyBgngDt": start.isoformat(),
+            "aplyEndDt": dl.isoformat(),
+            "categoryNm": rng.choice(CATEGORIES),
+            "outsdInstNm": rng.choice(ORGS) if i % 2 else "",
+            "insttNm": rng.choice(ORGS),
+            "mdfcnDt": start.isoformat(),
+        })
+    return json.dumps({"value": items, "result": "success"}, ensure_ascii=False)
+
+
+def smtech(rng):
+    cells = []
+    for i, t in enumerate(titles(rng, ROWS)):
+        start = day(rng, -20, 0)
+        dl = day(rng, 0)
+        cells.append(
+            f'<td><span class="day">{i % 28 + 1}</span>'
+            f'<a href="/front/ifg/no/notice02_list.do;jsessionid=ABC{i}?searchCondition=&amp;ancmId=S{2026100 + i}&amp;pageIndex=1">'
+            f'<img src="/images/icon_ancm.png" alt="공고" title="{t} {start.strftime("%Y.%m.%d")} ~ {dl.strftime("%Y.%m.%d")}"/></a></td>'
+        )
+    rows = ["<tr>" + "".join(cells[i:i + 7]) + "</tr>" for i in range(0, len(cells), 7)]
+    return page('<table class="calendar"><tbody>' + "\n".join(rows) + "</tbody></table>", "SMTECH")
+
+
+def smes24(rng):
+    rows = []
+    popups = []
+    for i, t in enumerate(titles(rng, ROWS)):
+        start = day(rng, -20, 0)
+        dl = day(rng, 0)
+        org = rng.choice(ORGS)
+        pid = f"PBLN_{119000 + i:015d}"
+        rows.append(
+            f'<tr><td>{i + 1}</td>'
+            f'<td class="tl"><a href="#none" title="{t}" onclick="fn_include_popOpen2(\'{5000 + i}\',\'{i}\', \'C{i % 7}\', \'{pid}\',\'{org}\', \'접수중\')">{t[:20]}…</a></td>'
+            f'<td>{start.isoformat()} ~ {dl.isoformat()}</td><td>접수중</td><td>{rng.choice(CATEGORIES)}</td><td>{org}</td></tr>'
+        )
+        popups.append(
+            f'if(index == "{i}"){{ fn_popupDtl(\'{pid}\', \'https://www.smes.go.kr/main/dtl?pblancId={pid}|amp;seq={5000 + i}\'); }}'
+        )
+    script = "<script>function fn_open(index){\n" + "\n".join(popups) + "\n}</script>"
+    return page('<table class="list"><tbody>' + "\n".join(rows) + "</tbody></table>" + script, "중소벤처24")
+
+
+def gosims(rng):
+    items = []
+    for i, t in enumerate(titles(rng, ROWS)):
+        start = day(rng, -20, 0)
+        dl = day(rng, 0)
+        items.append({
+            "nttId": f"{600000 + i}",
+            "sjCn": t,
+            "rceptBeginDe": start.strftime("%Y-%m-%d"),
+            "rceptEndDe": dl.strftime("%Y-%m-%d"),
+            "pssrpInsttNm": rng.choice(ORGS),
+            "pblancSeCode": "A" if i % 2 else "B",
+            "bsnsSe": str(i % 3),
+        })
+    return json.dumps({"ntbdList": items, "totCnt": len(items)}, ensure_ascii=False)
+
+
+def detail(rng):
+    # 상세페이지: 긴 메뉴/스크립트 뒤 본문 중간쯤에 지원금 문구가 있는 전형적인 구조
+    paras = []
+    for i in range(60):
+        paras.append(f"<p>사업 개요 {i}: 본 사업은 {rng.choice(ORGS)} 주관으로 {rng.choice(CATEGORIES)} 분야 기업을 지원합니다.</p>")
+    paras.insert(35, "<table><tr><th>지원규모</th><td>기업당 최대 1억 5천만원 (총 사업비의 70% 이내)</td></tr></table>")
+    return page("<div class='view'>" + "\n".join(paras) + "</div>", "공고 상세")
+
+
+FIXTURES = {
+    "kstartup.html": kstartup,
+    "bizinfo.html": bizinfo,
+    "iris.json": iris,
+    "egbiz.json": egbiz,
+    "smtech.html": smtech,
+    "smes24.html": smes24,
+    "gosims.json": gosims,
+    "detail.html": detail,
+}
+
+
+def main():
+    OUT.mkdir(exist_ok=True)
+    for name, fn in FIXTURES.items():
+        text = fn(random.Random(name))
+        (OUT / name).write_text(text, encoding="utf-8")
+        print(f"{name}: {len(text.encode('utf-8')):,} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,89 @@
 #!/usr/bin/env python3
-import re, json, html
-from urllib.request import Request, urlopen
-from urllib.parse import urlencode
+import re, json, html, threading, time, argparse, codecs, hashlib, random, gzip
+from html.parser import HTMLParser
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode, urlsplit
 from datetime import date, datetime
 from pathlib import Path
 
-UA = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
-BASE = Path(__file__).resolve().parent
-
+from notice_http import cache, cache_key, client, ttl_for, Cassette, RecordingReader, Response, DETAIL_TTL
+from notice_metrics import metrics, BuildProfiler
 
-def get(url: str) -> str:
-    req = Request(url, headers={"User-Agent": UA, "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8"})
-    with urlopen(req, timeout=20) as r:
-        return r.read().decode("utf-8", errors="ignore")
+try:
+    import brotli  # 선택: 있으면 .br 사본도 만든다
+except ImportError:
+    brotli = None
 
+UA = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
+BASE = Path(__file__).resolve().parent
 
-def post_text(url: str, data: dict, extra_headers=None) -> str:
+# 상세페이지 병렬 수집 설정
+FETCH_WORKERS = 12
+DETAIL_BYTE_BUDGET = 384 * 1024  # 상세페이지당 최대 읽기량(압축 해제 후)
+HOST_CONCURRENCY = 4  # 호스트당 동시 요청 수
+HOST_DELAY = 0.2  # 같은 호스트 요청 시작 간 최소 간격(초)
+
+# --record/--replay 때의 카세트(notice_http.Cassette). None 이면 평소대로 네트워크/캐시 사용
+CASSETTE = None
+
+
+def fetch_cached(method: str, url: str, headers: dict, body: bytes = None, ttl: int = None, key: str = None, read=None) -> str:
+    # 요청마다 소요 시간/본문 크기/재시도/캐시 결과를 현재 소스의 계측에 남긴다.
+    # 카세트가 있으면 재생 모드에선 녹화본으로 응답하고, 녹화 모드에선 응답(또는 실패)을 함께 적는다.
+    key = key or cache_key(method, url, body or b"")
+    client.take_retries()
+    t0 = time.perf_counter()
+    outcome = "error"
+    txt = ""
+    err = None
+    tap = None
+    try:
+        if CASSETTE and CASSETTE.replaying:
+            txt, raw = CASSETTE.play(key, url)
+            if read and raw is not None:
+                # 스트리밍 요청은 녹화한 원문을 read 에 다시 흘려 상세 파싱까지 재현한다
+                txt = read(Response(url, 200, "OK", {}, raw))
+            outcome = "replay"
+        else:
+            if CASSETTE and read:
+                read = tap = RecordingReader(read, DETAIL_BYTE_BUDGET)
+            outcome, txt = _fetch_cached(method, url, headers, body, ttl, key, read)
+        return txt
+    except Exception as e:
+        err = e
+        raise
+    finally:
+        seconds = time.perf_counter() - t0
+        metrics.record_request(url, seconds, len(txt.encode("utf-8")), outcome, client.take_retries())
+        if CASSETTE and not CASSETTE.replaying:
+            CASSETTE.record(key, method, url, body, txt, seconds, err, tap.raw if tap else None)
+
+
+def _fetch_cached(method, url, headers, body, ttl, key, read) -> tuple:
+    # TTL 안이면 캐시로 응답, 지나면 조건부 요청 후 304면 캐시 본문 재사용
+    # read 를 주면 응답을 스트리밍으로 넘겨 read(response) 결과를 저장한다.
+    entry = cache.load(key)
+    if cache.fresh(entry, ttl_for(url) if ttl is None else ttl):
+        cache.count("hits")
+        return "hit", entry["body"]
+    headers = {**headers, **cache.conditional_headers(entry)}
+    with client.request(method, url, body=body, headers=headers, stream=read is not None) as r:
+        if r.status == 304 and entry:
+            cache.count("revalidated")
+            cache.touch(key, entry)
+            return "revalidated", entry["body"]
+        txt = read(r) if read else r.text()
+    cache.store(key, url, txt, r.headers)
+    cache.count("misses")
+    return "miss", txt
+
+
+def get(url: str, ttl: int = None) -> str:
+    headers = {"User-Agent": UA, "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8"}
+    return fetch_cached("GET", url, headers, ttl=ttl)
+
+
+def post_text(url: str, data: dict, extra_headers=None, ttl: int = None) -> str:
     body = urlencode(data).encode("utf-8")
     headers = {
         "User-Agent": UA,
@@ -27,9 +95,195 @@ def post_text(url: str, data: dict, extra_headers=None) -> str:
     }
     if extra_headers:
         headers.update(extra_headers)
-    req = Request(url, data=body, headers=headers)
-    with urlopen(req, timeout=20) as r:
-        return r.read().decode("utf-8", errors="ignore")
+    return fetch_cached("POST", url, headers, body, ttl)
+
+
+class HostGate:
+    # 호스트별 동시 요청 수 제한 + 요청 시작 간격(politeness delay) 보장
+    def __init__(self, limit: int, delay: float):
+        self.sem = threading.Semaphore(limit)
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.next_at = 0.0
+
+    def __enter__(self):
+        self.sem.acquire()
+        with self.lock:
+            now = time.monotonic()
+            wait = self.next_at - now
+            self.next_at = max(now, self.next_at) + self.delay
+        if wait > 0:
+            time.sleep(wait)
+        return self
+
+    def __exit__(self, *exc):
+        self.sem.release()
+
+
+_gates = {}
+_gates_lock = threading.Lock()
+
+
+def host_gate(url: str) -> HostGate:
+    host = urlsplit(url).netloc
+    with _gates_lock:
+        gate = _gates.get(host)
+        if gate is None:
+            gate = _gates[host] = HostGate(HOST_CONCURRENCY, HOST_DELAY)
+        return gate
+
+
+def fetch_all(urls, handler=None, workers: int = FETCH_WORKERS, fetch=None) -> dict:
+    """URL 목록을 병렬로 가져와 {url: handler(본문)}을 반환. 실패한 URL은 결과에서 빠진다.
+    fetch 를 주면 get 대신 fetch(url) 로 본문을 가져온다."""
+    urls = list(dict.fromkeys(u for u in urls if u))
+    source = metrics.current_source()
+
+    def work(url):
+        with metrics.source(source), host_gate(url):
+            txt = fetch(url) if fetch else get(url, ttl=DETAIL_TTL)
+        return handler(txt) if handler else txt
+
+    out = {}
+    if not urls:
+        return out
+    with ThreadPoolExecutor(max_workers=min(workers, len(urls))) as ex:
+        futs = {u: ex.submit(work, u) for u in urls}
+        for u, fut in futs.items():
+            try:
+                out[u] = fut.result()
+            except Exception:
+                pass
+    return out
+
+
+PAGE_WORKERS = 6  # 목록 API 페이지 동시 요청 수
+
+
+def fetch_paginated(url: str, fetch_page, max_pages: int, page_count=None, workers: int = PAGE_WORKERS) -> list:
+    """1페이지를 받아 page_count(1페이지 결과)로 전체 페이지 수를 알아낸 뒤
+    나머지 페이지를 동시에 받아 페이지 순서대로 돌려준다. page_count 가 없으면 max_pages 를 모두 받는다."""
+    gate = host_gate(url)
+    source = metrics.current_source()
+
+    def work(page: int):
+        with metrics.source(source), gate:
+            return fetch_page(page)
+
+    first = work(1)
+    total = min(max_pages, page_count(first) if page_count else max_pages)
+    if total <= 1:
+        return [first]
+    with ThreadPoolExecutor(max_workers=min(workers, total - 1)) as ex:
+        return [first] + list(ex.map(work, range(2, total + 1)))
+
+
+# 증분 빌드: 이전 notices.json 의 공고(id 기준). 비어 있으면 전체 빌드.
+PREVIOUS = {}
+# 상세페이지 재수집 여부를 가르는 목록 단계 필드(dday 는 매일 바뀌므로 제외)
+LIST_FIELDS = ("title", "category", "deadline", "period", "regDate", "url")
+detail_stats = {"fetched": 0, "reused": 0, "failed": 0}
+_detail_stats_lock = threading.Lock()
+
+
+def load_snapshot(path: Path) -> dict:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def list_signature(n: dict) -> tuple:
+    return tuple(n.get(k) or "" for k in LIST_FIELDS)
+
+
+def attach_support_amounts(notices: list) -> list:
+    # 신규 공고나 목록 필드가 바뀐 공고만 상세페이지를 받고, 나머지는 이전 지원금을 그대로 쓴다.
+    # 상세 수집에 실패한 공고는 supportAmount 를 비워 두어 다음 빌드에서 다시 시도한다.
+    todo = []
+    changed = set()
+    reused = 0
+    for n in notices:
+        old = PREVIOUS.get(n["id"])
+        if old and "supportAmount" in old and list_signature(old) == list_signature(n):
+            text = old["supportAmount"]
+            if "supportAmountKrw" in old:
+                amount = {"text": text, "krw": old["supportAmountKrw"], "upTo": bool(old.get("supportAmountUpTo"))}
+            else:
+                # supportAmountKrw 가 없던 이전 결과는 문자열에서 다시 계산
+                amount = {"text": text, "krw": AMOUNTS.parse_krw(text), "upTo": bool(AMOUNTS.upper_re.search(text))}
+            set_support_amount(n, amount)
+            reused += 1
+        else:
+            todo.append(n)
+            if old and list_signature(old) != list_signature(n):
+                changed.add(n["url"])
+
+    # 목록 필드가 바뀐 공고는 상세 캐시 TTL 을 무시하고 최소한 조건부 요청으로 재검증한다
+    texts = fetch_all([n["url"] for n in todo], fetch=lambda u: read_detail_text(u, ttl=0 if u in changed else DETAIL_TTL))
+    urls = list(texts)
+    amounts = dict(zip(urls, AMOUNTS.extract_many(texts[u] for u in urls)))
+    failed = 0
+    for n in todo:
+        if n["url"] in amounts:
+            set_support_amount(n, amounts[n["url"]])
+        else:
+            for k in ("supportAmount", "supportAmountKrw", "supportAmountUpTo"):
+                n.pop(k, None)
+            failed += 1
+
+    with _detail_stats_lock:
+        detail_stats["reused"] += reused
+        detail_stats["fetched"] += len(todo) - failed
+        detail_stats["failed"] += failed
+    return notices
+
+
+class DetailText(HTMLParser):
+    # 상세페이지에서 본문 텍스트만 모은다(스크립트/스타일/메뉴/헤더/푸터는 건너뜀).
+    # feed() 로 조각을 넣을 수 있어 페이지 전체를 메모리에 올리지 않는다.
+    SKIP = frozenset(("script", "style", "noscript", "template", "head", "header", "nav", "footer", "aside", "select"))
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self.skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP:
+            self.skip += 1
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIP and self.skip:
+            self.skip -= 1
+
+    def handle_data(self, data):
+        if not self.skip:
+            self.parts.append(data)
+
+    def text(self) -> str:
+        return re.sub(r"\s+", " ", "".join(self.parts)).strip()
+
+
+def read_detail_stream(r, budget: int = DETAIL_BYTE_BUDGET) -> str:
+    # 응답을 조각 단위로 디코딩하며 본문 텍스트를 모은다.
+    # 지원금 키워드 근처 금액이 확정되거나 읽기 예산을 넘으면 나머지는 받지 않는다.
+    parser = DetailText()
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+    read = 0
+    for chunk in r.iter_content():
+        read += len(chunk)
+        parser.feed(decoder.decode(chunk))
+        if read >= budget or keyword_amount(parser.text(), complete=False):
+            break
+    parser.close()
+    return parser.text()
+
+
+def read_detail_text(url: str, ttl: int = DETAIL_TTL) -> str:
+    # 상세페이지 본문 텍스트(캐시에는 원문 대신 추출 텍스트를 저장)
+    headers = {"User-Agent": UA, "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8"}
+    return fetch_cached("GET", url, headers, ttl=ttl, key=cache_key("DETAIL", url), read=read_detail_stream)
 
 
 def clean(s: str) -> str:
@@ -38,45 +292,132 @@ def clean(s: str) -> str:
     s = re.sub(r"\s+", " ", s).strip()
     return s
 
-def extract_support_amount(text: str) -> str:
-    t = clean(text or "")
-    if not t:
-        return ""
 
-    money_patterns = [
-        r"\d[\d,]*(?:\.\d+)?\s*억\s*\d*[\d,]*(?:\.\d+)?\s*만\s*원",
-        r"\d[\d,]*(?:\.\d+)?\s*억\s*원",
-        r"\d[\d,]*(?:\.\d+)?\s*천\s*만\s*원",
-        r"\d[\d,]*(?:\.\d+)?\s*만\s*원",
-        r"\d[\d,]*(?:\.\d+)?\s*원",
-    ]
-    money_re = re.compile("(" + "|".join(money_patterns) + ")")
-
-    keyword_re = re.compile(r"(지원금|지원규모|지원예산|지원한도|보조금|사업비)")
-
-    # 1) 키워드 근처 금액 우선 추출
-    for m in keyword_re.finditer(t):
-        st = max(0, m.start() - 20)
-        ed = min(len(t), m.end() + 60)
-        snippet = t[st:ed]
-        mm = money_re.search(snippet)
-        if mm:
-            val = mm.group(1)
-            if len(val) <= 2:
-                continue
-            return f"{m.group(1)} {val}".replace("  ", " ").strip()
+MONEY_PATTERNS = [
+    r"\d[\d,]*(?:\.\d+)?\s*억\s*\d+\s*천\s*만\s*원",
+    r"\d[\d,]*(?:\.\d+)?\s*억\s*\d*[\d,]*(?:\.\d+)?\s*만\s*원",
+    r"\d[\d,]*(?:\.\d+)?\s*억\s*원",
+    r"\d[\d,]*(?:\.\d+)?\s*천\s*만\s*원",
+    r"\d[\d,]*(?:\.\d+)?\s*만\s*원",
+    r"\d[\d,]*(?:\.\d+)?\s*원",
+]
+KEYWORDS = ("지원금", "지원규모", "지원예산", "지원한도", "보조금", "사업비")
+KEYWORD_BEFORE = 20
+KEYWORD_AFTER = 60
+UPPER_AFTER = 6  # 금액 바로 뒤 "이내"/"한도" 를 찾는 범위(글자)
+UPPER_BEFORE = 12  # 금액 앞 "총"/"최대" 를 찾는 범위(글자, "총 사업비 3억원" 처럼 명사 하나를 건너뛴다)
+KRW_UNITS = {"억": 10**8, "천만": 10**7, "만": 10**4, "천": 10**3, "": 1}
+
+
+class AmountExtractor:
+    # 지원금 추출 엔진: 패턴은 생성 시 한 번만 컴파일하고 문서 여러 건에 재사용한다.
+    # 결과는 {"text": "지원금 100만원", "krw": 1000000, "upTo": False} 형태.
+    def __init__(self):
+        self.money_re = re.compile("(" + "|".join(MONEY_PATTERNS) + ")")
+        self.keyword_re = re.compile("(" + "|".join(KEYWORDS) + ")")
+        self.bounded_re = re.compile(r"(최대|총)\s*" + self.money_re.pattern)
+        self.bare_re = re.compile(r"\d[\d,]*(?:\.\d+)?\s*(?:억\s*\d+\s*천\s*만\s*원|억\s*\d*[\d,]*(?:\.\d+)?\s*만\s*원|억\s*원|천\s*만\s*원|만\s*원)")
+        self.upper_re = re.compile(r"최대|총|한도|이내")
+        self.upper_after_re = re.compile(r"\s*(?:이내|한도)")
+        self.upper_before_re = re.compile(r"(?:최대|총)\s*(?:[가-힣]+\s*)?$")
+        self.token_re = re.compile(r"(\d+(?:\.\d+)?)\s*(억|천\s*만|만|천|)")
+        self.space_re = re.compile(r"\s+")
+
+    def parse_krw(self, s: str):
+        # "1억 5,000만원" -> 150000000, "5천만원" -> 50000000, 금액이 없으면 None
+        total = 0.0
+        found = False
+        for num, unit in self.token_re.findall((s or "").replace(",", "")):
+            total += float(num) * KRW_UNITS[unit.replace(" ", "")]
+            found = True
+        return int(round(total)) if found else None
+
+    def keyword_match(self, t: str, complete: bool = True):
+        # 키워드 근처 금액. complete=False 면 아직 덜 받은 텍스트로 보고,
+        # 키워드 뒤 검색 범위가 다 채워진 매치만 확정한다.
+        for m in self.keyword_re.finditer(t):
+            if not complete and m.end() + KEYWORD_AFTER > len(t):
+                return None
+            st = max(0, m.start() - KEYWORD_BEFORE)
+            ed = min(len(t), m.end() + KEYWORD_AFTER)
+            snippet = t[st:ed]
+            mm = self.money_re.search(snippet)
+            if mm:
+                val = mm.group(1)
+                if len(val) <= 2:
+                    continue
+                between = snippet[m.end() - st:mm.start()] if mm.start() > m.end() - st else ""
+                # "최대 1억원"/"총 사업비 3억원" 처럼 앞에 오거나 "1억2천만원 이내" 처럼 금액 바로 뒤에 오는 상한 표현
+                before = st + mm.start()
+                after = st + mm.end()
+                if not complete and after + UPPER_AFTER > len(t):
+                    return None
+                up_to = (m.group(1) == "지원한도" or bool(self.upper_re.search(between))
+                         or bool(self.upper_before_re.search(t, max(0, before - UPPER_BEFORE), before))
+                         or bool(self.upper_after_re.match(t, after, after + UPPER_AFTER)))
+                return self.result(f"{m.group(1)} {val}".replace("  ", " ").strip(), val, up_to)
+        return None
 
-    # 2) 최대/총 + 금액 패턴
-    m2 = re.search(r"(최대|총)\s*" + money_re.pattern, t)
-    if m2:
-        return re.sub(r"\s+", " ", m2.group(0)).strip()
+    def result(self, text: str, money: str, up_to: bool) -> dict:
+        return {"text": text, "krw": self.parse_krw(money), "upTo": up_to}
 
-    # 3) 금액 단독 (과도한 숫자 노이즈 방지: 만원/억/천만원 우선)
-    m3 = re.search(r"\d[\d,]*(?:\.\d+)?\s*(?:억\s*\d*[\d,]*(?:\.\d+)?\s*만\s*원|억\s*원|천\s*만\s*원|만\s*원)", t)
-    if m3:
-        return re.sub(r"\s+", " ", m3.group(0)).strip()
+    def extract(self, t: str) -> dict:
+        # 태그가 제거된 텍스트에서 지원금 추출
+        if not t:
+            return self.result("", "", False)
+
+        # 1) 키워드 근처 금액 우선 추출
+        found = self.keyword_match(t)
+        if found:
+            return found
+
+        # 2) 최대/총 + 금액 패턴
+        m2 = self.bounded_re.search(t)
+        if m2:
+            return self.result(self.space_re.sub(" ", m2.group(0)).strip(), m2.group(2), True)
+
+        # 3) 금액 단독 (과도한 숫자 노이즈 방지: 만원/억/천만원 우선)
+        m3 = self.bare_re.search(t)
+        if m3:
+            return self.result(self.space_re.sub(" ", m3.group(0)).strip(), m3.group(0), False)
+
+        return self.result("", "", False)
+
+    def extract_many(self, texts) -> list:
+        # 배치 처리: 같은 본문은 한 번만 분석
+        memo = {}
+        out = []
+        for t in texts:
+            t = t or ""
+            if t not in memo:
+                memo[t] = self.extract(t)
+            out.append(dict(memo[t]))
+        return out
 
-    return ""
+
+AMOUNTS = AmountExtractor()
+
+
+def keyword_amount(t: str, complete: bool = True) -> str:
+    found = AMOUNTS.keyword_match(t, complete)
+    return found["text"] if found else ""
+
+
+def support_amount_from_text(t: str) -> str:
+    return AMOUNTS.extract(t)["text"]
+
+
+def extract_support_amount(text: str) -> str:
+    return support_amount_from_text(clean(text or ""))
+
+
+def set_support_amount(n: dict, amount: dict) -> None:
+    n["supportAmount"] = amount["text"]
+    n["supportAmountKrw"] = amount["krw"]
+    if amount["upTo"]:
+        n["supportAmountUpTo"] = True
+    else:
+        n.pop("supportAmountUpTo", None)
 
 
 def days_until(deadline: str):
@@ -117,32 +458,213 @@ def extract_deadline_from_text(s: str) -> str:
     return ""
 
 
+class HtmlEvents(HTMLParser):
+    # 목록 페이지 토크나이저: (start/end/text) 이벤트를 한 번의 선형 스캔으로 만든다.
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.events = []
+
+    def handle_starttag(self, tag, attrs):
+        self.events.append(("start", tag, {k: v or "" for k, v in attrs}))
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        self.events.append(("end", tag, None))
+
+    def handle_endtag(self, tag):
+        self.events.append(("end", tag, None))
+
+    def handle_data(self, data):
+        self.events.append(("text", data, None))
+
+
+def iter_html_events(txt: str, chunk: int = 64 * 1024):
+    # 페이지를 조각 단위로 토크나이저에 넣고 쌓인 이벤트를 바로 흘려보낸다.
+    p = HtmlEvents()
+    for i in range(0, len(txt), chunk):
+        p.feed(txt[i:i + chunk])
+        yield from p.events
+        p.events.clear()
+    p.close()
+    yield from p.events
+
+
+def squash(s: str) -> str:
+    return re.sub(r"\s+", " ", s).strip()
+
+
+class Link:
+    __slots__ = ("attrs", "parts")
+
+    def __init__(self, attrs: dict):
+        self.attrs = attrs
+        self.parts = []
+
+    @property
+    def text(self) -> str:
+        return squash("".join(self.parts))
+
+
+class Cell:
+    __slots__ = ("attrs", "parts", "links")
+
+    def __init__(self, attrs: dict):
+        self.attrs = attrs
+        self.parts = []
+        self.links = []
+
+    @property
+    def text(self) -> str:
+        return squash("".join(self.parts))
+
+
+class Row:
+    # <tr> 한 행: 셀 목록, 행 안의 링크, 행 안 모든 요소의 속성
+    __slots__ = ("attrs", "cells", "links", "elements")
+
+    def __init__(self, attrs: dict):
+        self.attrs = attrs
+        self.cells = []
+        self.links = []
+        self.elements = []
+
+    def search_attrs(self, pattern):
+        # 행 안 요소들의 속성값(onclick/href 등)에서 처음 매치되는 것
+        for _, attrs in self.elements:
+            for v in attrs.values():
+                m = pattern.search(v)
+                if m:
+                    return m
+        return None
+
+
+def iter_rows(txt: str, container: str = None):
+    """목록 페이지의 <tr> 행을 한 번의 스캔으로 순서대로 돌려준다.
+    container 를 주면(예: "tbody") 처음 나오는 그 요소 안의 행만 본다."""
+    stack = []
+    cell = None
+    link = None
+    inside = container is None
+    depth = 0
+    for kind, tag, attrs in iter_html_events(txt):
+        if container is not None:
+            if kind == "start" and tag == container:
+                if not inside and depth == 0:
+                    inside = True
+                depth += inside
+            elif kind == "end" and tag == container and inside:
+                depth -= 1
+                if depth == 0:
+                    return
+            if not inside:
+                continue
+
+        if kind == "start":
+            if tag == "tr":
+                stack.append(Row(attrs))
+                cell = link = None
+                continue
+            if not stack:
+                continue
+            row = stack[-1]
+            row.elements.append((tag, attrs))
+            if tag == "td":
+                cell = Cell(attrs)
+                row.cells.append(cell)
+                link = None
+            elif tag == "a":
+                link = Link(attrs)
+                row.links.append(link)
+                if cell is not None:
+                    cell.links.append(link)
+        elif kind == "end":
+            if tag == "tr" and stack:
+                yield stack.pop()
+                cell = stack[-1].cells[-1] if stack and stack[-1].cells else None
+                link = None
+            elif tag == "td":
+                cell = link = None
+            elif tag == "a":
+                link = None
+        elif stack:
+            if cell is not None:
+                cell.parts.append(tag)
+            if link is not None:
+                link.parts.append(tag)
+
+
+KSTARTUP_VIEW_RE = re.compile(r"go_view\((\d+)\)")
+KSTARTUP_TYPE_RE = re.compile(r"^flag type\d+$")
+KSTARTUP_DDAY_RE = re.compile(r"^D-(\d+)$")
+KSTARTUP_DEADLINE_RE = re.compile(r"마감일자\s*([0-9\-]{10})")
+
+
+def iter_kstartup_cards(txt: str):
+    # 카드 한 장 = go_view(번호) -> 분류 flag -> D-day flag -> 마감일자 -> 제목(p.tit) 순서.
+    # 다음 항목만 기다리는 상태기계라 페이지를 한 번만 훑는다.
+    card = None
+    grab = None  # 텍스트를 모으는 중인 [필드명, 태그, 조각들]
+    for kind, tag, attrs in iter_html_events(txt):
+        if grab is not None:
+            field, grab_tag, parts = grab
+            if kind == "text":
+                parts.append(tag)
+                continue
+            if kind == "end" and tag == grab_tag:
+                grab = None
+                value = "".join(parts).strip()
+                if field == "category" and value:
+                    card["category"] = value
+                elif field == "dday" and KSTARTUP_DDAY_RE.match(value):
+                    card["dday"] = KSTARTUP_DDAY_RE.match(value).group(1)
+                elif field == "title":
+                    yield card["sn"], card["category"], card["dday"], card["deadline"], value
+                    card = None
+                continue
+            if field == "title":
+                continue
+            # 분류/D-day span 안에 태그가 끼어 있으면 건너뛴다
+            grab = None
+
+        if card is None:
+            values = [tag] if kind == "text" else (attrs.values() if kind == "start" else ())
+            for v in values:
+                m = KSTARTUP_VIEW_RE.search(v)
+                if m:
+                    card = {"sn": m.group(1)}
+                    break
+            continue
+
+        if kind == "text":
+            if "dday" in card and "deadline" not in card:
+                m = KSTARTUP_DEADLINE_RE.search(tag)
+                if m:
+                    card["deadline"] = m.group(1)
+            continue
+        if kind != "start":
+            continue
+        cls = attrs.get("class", "")
+        if "category" not in card:
+            if tag == "span" and KSTARTUP_TYPE_RE.match(cls):
+                grab = ["category", tag, []]
+        elif "dday" not in card:
+            if tag == "span" and cls == "flag day":
+                grab = ["dday", tag, []]
+        elif "deadline" in card and tag == "p" and cls == "tit":
+            grab = ["title", tag, []]
+
+
 def parse_kstartup() -> list:
     url = "https://www.k-startup.go.kr/web/contents/bizpbanc-ongoing.do"
     txt = get(url)
-    pat = re.compile(
-        r"go_view\((\d+)\).*?"
-        r"<span class=\"flag type\d+\">\s*([^<]+?)\s*</span>.*?"
-        r"<span class=\"flag day\">\s*D-(\d+)\s*</span>.*?"
-        r"마감일자\s*([0-9\-]{10}).*?"
-        r"<p class=\"tit\">\s*(.*?)\s*</p>",
-        re.S,
-    )
     out = []
     seen = set()
-    for m in pat.finditer(txt):
-        pbanc_sn, category, dday, deadline, title = m.groups()
+    for pbanc_sn, category, dday, deadline, title in iter_kstartup_cards(txt):
         title = clean(title)
         if not title or pbanc_sn in seen:
             continue
         seen.add(pbanc_sn)
         detail_url = f"https://www.k-startup.go.kr/web/contents/bizpbanc-ongoing.do?schM=view&pbancSn={pbanc_sn}"
-        support_amount = ""
-        try:
-            detail_txt = get(detail_url)
-            support_amount = extract_support_amount(detail_txt)
-        except Exception:
-            support_amount = ""
 
         out.append(
             {
@@ -152,32 +674,33 @@ def parse_kstartup() -> list:
                 "category": clean(category),
                 "deadline": deadline,
                 "dday": int(dday),
-                "supportAmount": support_amount,
+                "supportAmount": "",
+                "supportAmountKrw": None,
                 "url": detail_url,
             }
         )
-    return out[:80]
+    return attach_support_amounts(out[:80])
+
+
+BIZINFO_LINK_RE = re.compile(r"[^\"]*pblancId=PBLN_[0-9]+")
 
 
 def parse_bizinfo() -> list:
     url = "https://www.bizinfo.go.kr/web/lay1/bbs/S1T122C128/AS/74/list.do"
     txt = get(url)
-    rows = re.findall(r"<tr>.*?</tr>", txt, flags=re.S)
     out = []
-    for row in rows:
-        if "pblancId=PBLN_" not in row:
+    for row in iter_rows(txt):
+        tds = row.cells
+        if len(tds) < 7 or not row.search_attrs(BIZINFO_LINK_RE):
             continue
-        tds = re.findall(r"<td[^>]*>(.*?)</td>", row, flags=re.S)
-        if len(tds) < 7:
+        category = tds[1].text
+        link = next((a for a in tds[2].links if BIZINFO_LINK_RE.search(a.attrs.get("href", ""))), None)
+        if link is None:
             continue
-        category = clean(tds[1])
-        link_match = re.search(r"<a\s+href=\s*\"([^\"]*pblancId=PBLN_[0-9]+)[^\"]*\"[^>]*>(.*?)</a>", tds[2], flags=re.S)
-        if not link_match:
-            continue
-        href, title = link_match.groups()
-        title = clean(title)
-        period = clean(tds[3])
-        reg_date = clean(tds[6])
+        href = BIZINFO_LINK_RE.search(link.attrs["href"]).group(0)
+        title = clean(link.text)
+        period = tds[3].text
+        reg_date = tds[6].text
 
         dl_match = re.search(r"~\s*([0-9]{4}-[0-9]{2}-[0-9]{2})", period)
         deadline = dl_match.group(1) if dl_match else ""
@@ -187,13 +710,6 @@ def parse_bizinfo() -> list:
         pid_match = re.search(r"(PBLN_[0-9]+)", full_url)
         pid = pid_match.group(1) if pid_match else str(abs(hash(full_url)))
 
-        support_amount = ""
-        try:
-            detail_txt = get(full_url)
-            support_amount = extract_support_amount(detail_txt)
-        except Exception:
-            support_amount = ""
-
         out.append(
             {
                 "id": f"b-{pid}",
@@ -204,11 +720,12 @@ def parse_bizinfo() -> list:
                 "dday": dday,
                 "period": period,
                 "regDate": reg_date,
-                "supportAmount": support_amount,
+                "supportAmount": "",
+                "supportAmountKrw": None,
                 "url": full_url,
             }
         )
-    return out[:140]
+    return attach_support_amounts(out[:140])
 
 
 def parse_iris() -> list:
@@ -217,7 +734,7 @@ def parse_iris() -> list:
     out = []
     seen = set()
 
-    for page in range(1, 40):
+    def fetch_page(page: int) -> dict:
         raw = post_text(
             api,
             {
@@ -231,7 +748,13 @@ def parse_iris() -> list:
                 "Referer": "https://www.iris.go.kr/main.do",
             },
         )
-        obj = json.loads(raw)
+        return json.loads(raw)
+
+    def page_count(obj: dict) -> int:
+        p = obj.get("bsnsAncmPaginationInfo", {}) or {}
+        return int(p.get("totalPageCount") or 1)
+
+    for obj in fetch_paginated(api, fetch_page, 39, page_count):
         rows = obj.get("listBsnsAncm", []) or []
         if not rows:
             break
@@ -274,23 +797,18 @@ def parse_iris() -> list:
                 }
             )
 
-        # 페이지네이션 끝 감지
-        p = obj.get("bsnsAncmPaginationInfo", {}) or {}
-        total_pages = int(p.get("totalPageCount") or 1)
-        if page >= total_pages:
-            break
-
     return out[:260]
 
 
 def parse_egbiz() -> list:
     url = "https://www.egbiz.or.kr/sp/selectSupportPrjListAjax.do"
 
-    # month/day별로 분산돼 있어 12개월 조회 후 합치기
+    def fetch_month(m: int) -> dict:
+        return json.loads(post_text(url, {"month": str(m), "day": "1", "sortCd": "bizCyclId"}))
+
+    # month/day별로 분산돼 있어 12개월 조회 후 합치기(12개월은 동시에 조회)
     merged = {}
-    for m in range(1, 13):
-        raw = post_text(url, {"month": str(m), "day": "1", "sortCd": "bizCyclId"})
-        obj = json.loads(raw)
+    for obj in fetch_paginated(url, fetch_month, 12):
         for item in obj.get("value", []) or []:
             biz_id = item.get("bizCyclId")
             if not biz_id:
@@ -325,21 +843,33 @@ def parse_egbiz() -> list:
     return out[:180]
 
 
+SMTECH_HREF_RE = re.compile(r"notice02_list\.do.*?ancmId=([^&\"]+)")
+
+
+def iter_smtech_links(txt: str):
+    # 월별 일정표 셀의 링크 + 아이콘 title에 공고명/접수기간이 함께 들어있음
+    # 링크(ancmId) 다음에 처음 나오는 title 있는 <img> 를 짝짓는다.
+    pending = None
+    for kind, tag, attrs in iter_html_events(txt):
+        if kind != "start":
+            continue
+        if pending is None:
+            if tag == "a":
+                m = SMTECH_HREF_RE.search(attrs.get("href", ""))
+                if m:
+                    pending = (attrs["href"], m.group(1))
+        elif tag == "img" and attrs.get("title"):
+            yield pending[0], pending[1], attrs["title"]
+            pending = None
+
+
 def parse_smtech() -> list:
     url = "https://www.smtech.go.kr/front/ifg/no/notice02_intro.do"
     txt = get(url)
 
-    # 월별 일정표 셀의 링크 + 아이콘 title에 공고명/접수기간이 함께 들어있음
-    pat = re.compile(
-        r"<a\s+href=\"([^\"]*notice02_list\.do[^\"]*ancmId=([^&\"]+)[^\"]*)\"[^>]*>\s*"
-        r"(?:.*?)<img[^>]*title=\"([^\"]+)\"",
-        re.S,
-    )
-
     out = []
     seen = set()
-    for m in pat.finditer(txt):
-        href, ancm_id, title_blob = m.groups()
+    for href, ancm_id, title_blob in iter_smtech_links(txt):
         if ancm_id in seen:
             continue
         seen.add(ancm_id)
@@ -371,6 +901,11 @@ def parse_smtech() -> list:
     return out[:120]
 
 
+SMES24_POPUP_RE = re.compile(
+    r"fn_include_popOpen2\('([^']*)','([^']*)',\s*'([^']*)',\s*'([^']*)','([^']*)',\s*'([^']*)'\)"
+)
+
+
 def parse_smes24() -> list:
     url = "https://www.smes.go.kr/main/bizApply"
     txt = get(url)
@@ -380,19 +915,11 @@ def parse_smes24() -> list:
     for idx, link in re.findall(r"if\(index\s*==\s*\"(\d+)\"\)\{.*?fn_popupDtl\('[^']*',\s*'([^']+)'", txt, flags=re.S):
         idx_to_url[idx] = link.replace("|amp;", "&")
 
-    tbody_m = re.search(r"<tbody>(.*?)</tbody>", txt, flags=re.S)
-    if not tbody_m:
-        return []
-
-    rows = re.findall(r"<tr>.*?</tr>", tbody_m.group(1), flags=re.S)
     out = []
     seen = set()
 
-    for row in rows:
-        args_m = re.search(
-            r"fn_include_popOpen2\('([^']*)','([^']*)',\s*'([^']*)',\s*'([^']*)','([^']*)',\s*'([^']*)'\)",
-            row,
-        )
+    for row in iter_rows(txt, container="tbody"):
+        args_m = row.search_attrs(SMES24_POPUP_RE)
         if not args_m:
             continue
 
@@ -401,16 +928,16 @@ def parse_smes24() -> list:
             continue
         seen.add(pblanc_id)
 
-        tds = re.findall(r"<td[^>]*>(.*?)</td>", row, flags=re.S)
+        tds = row.cells
         if len(tds) < 6:
             continue
 
-        title_a = re.search(r"<a [^>]*title=\"([^\"]+)\"", row, flags=re.S)
-        title = clean(title_a.group(1)) if title_a else clean(tds[1])
+        title_a = next((a for a in row.links if a.attrs.get("title")), None)
+        title = clean(title_a.attrs["title"]) if title_a else tds[1].text
 
-        period = clean(tds[2])
-        category = clean(tds[4])
-        org = clean(tds[5]) or org_from_args
+        period = tds[2].text
+        category = tds[4].text
+        org = tds[5].text or org_from_args
         deadline = extract_deadline_from_text(period)
 
         detail_url = idx_to_url.get(idx)
@@ -447,7 +974,7 @@ def parse_gosims() -> list:
     year = str(date.today().year)
     per_page = 200
 
-    for page in range(1, 6):
+    def fetch_page(page: int) -> dict:
         data = {
             "searchBsnsYear": year,
             "selSido": "",        # 전국
@@ -465,7 +992,13 @@ def parse_gosims() -> list:
                 "Referer": "https://www.bojo.go.kr/bojo.do",
             },
         )
-        obj = json.loads(raw)
+        return json.loads(raw)
+
+    def page_count(obj: dict) -> int:
+        # 전체 건수를 주지 않아 1페이지가 꽉 차 있으면 최대 페이지까지 미리 받아 둔다
+        return 1 if len(obj.get("ntbdList", []) or []) < per_page else 5
+
+    for obj in fetch_paginated(api, fetch_page, 5, page_count):
         rows = obj.get("ntbdList", []) or []
         if not rows:
             break
@@ -578,6 +1111,183 @@ def dedupe_notices(notices: list) -> tuple[list, int]:
     return list(by_key.values()), removed
 
 
+# 근접 중복(재공고/지역 접두어 차이 등) 묶기: 제목 shingle MinHash + LSH
+MINHASH_PERM = 64
+LSH_BANDS = 16  # 밴드당 4행 -> 유사도 약 0.5부터 후보
+NEAR_DUP_THRESHOLD = 0.75  # 후보쌍 확정용 실제 Jaccard 하한
+NEAR_DUP_NOISE = re.compile(r"재공고|추가공고|추가모집|공고|모집|안내")
+_MERSENNE = (1 << 61) - 1
+_rng = random.Random(20260225)  # 빌드마다 같은 해시 순열
+_PERMS = [(_rng.randrange(1, _MERSENNE), _rng.randrange(0, _MERSENNE)) for _ in range(MINHASH_PERM)]
+
+
+def title_shingles(title: str, k: int = 3) -> set:
+    t = NEAR_DUP_NOISE.sub(" ", normalize_title(title))
+    t = re.sub(r"\s+", "", t)
+    if len(t) <= k:
+        return {t} if t else set()
+    return {t[i:i + k] for i in range(len(t) - k + 1)}
+
+
+def minhash(shingles: set) -> list:
+    hs = [int.from_bytes(hashlib.blake2b(sh.encode("utf-8"), digest_size=8).digest(), "little") for sh in shingles]
+    return [min((a * h + b) % _MERSENNE for h in hs) for a, b in _PERMS]
+
+
+def near_dup_compatible(a: dict, b: dict) -> bool:
+    # 숫자(연도/차수)가 다르거나 마감일이 서로 다르면 다른 공고로 본다
+    if a["nums"] != b["nums"]:
+        return False
+    da, db = a["n"].get("deadline") or "", b["n"].get("deadline") or ""
+    return not (da and db and da != db)
+
+
+def cluster_near_duplicates(notices: list) -> tuple[list, dict]:
+    """정확 일치 중복 제거 뒤 남은 공고에서 제목이 거의 같은 공고를 묶어 품질 점수가 가장 높은 것만 남긴다.
+    LSH 버킷으로 후보쌍만 비교하므로 전체 쌍 비교(O(n²)) 없이 거의 선형으로 동작한다."""
+    docs = []
+    for n in notices:
+        sh = title_shingles(n.get("title") or "")
+        # 숫자는 괄호를 지우지 않은 제목에서 읽는다("(1차)"/"(2차)" 구분)
+        docs.append({"n": n, "sh": sh, "nums": tuple(re.findall(r"\d+", clean(n.get("title") or "").lower()))})
+
+    rows = MINHASH_PERM // LSH_BANDS
+    buckets = {}
+    for i, d in enumerate(docs):
+        if not d["sh"]:
+            continue
+        sig = minhash(d["sh"])
+        for band in range(LSH_BANDS):
+            key = (band, tuple(sig[band * rows:(band + 1) * rows]))
+            buckets.setdefault(key, []).append(i)
+
+    parent = list(range(len(docs)))
+    # 루트별 마감일. 마감일 없는 공고가 서로 다른 마감일의 두 공고를 잇지 못하도록 클러스터 단위로 확인한다
+    deadline = [d["n"].get("deadline") or "" for d in docs]
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    checked = set()
+    candidates = 0
+    for members in buckets.values():
+        if len(members) < 2:
+            continue
+        for x in range(len(members)):
+            for y in range(x + 1, len(members)):
+                i, j = members[x], members[y]
+                if (i, j) in checked:
+                    continue
+                checked.add((i, j))
+                candidates += 1
+                a, b = docs[i], docs[j]
+                jac = len(a["sh"] & b["sh"]) / len(a["sh"] | b["sh"])
+                if jac >= NEAR_DUP_THRESHOLD and near_dup_compatible(a, b):
+                    ri, rj = find(i), find(j)
+                    if ri == rj or (deadline[ri] and deadline[rj] and deadline[ri] != deadline[rj]):
+                        continue
+                    lo, hi = min(ri, rj), max(ri, rj)
+                    parent[hi] = lo
+                    deadline[lo] = deadline[lo] or deadline[hi]
+
+    clusters = {}
+    for i in range(len(docs)):
+        clusters.setdefault(find(i), []).append(i)
+
+    keep = set()
+    multi = 0
+    largest = 1 if docs else 0
+    for members in clusters.values():
+        best = members[0]
+        for i in members[1:]:
+            if notice_quality_score(docs[i]["n"]) > notice_quality_score(docs[best]["n"]):
+                best = i
+        keep.add(best)
+        if len(members) > 1:
+            multi += 1
+            largest = max(largest, len(members))
+
+    out = [d["n"] for i, d in enumerate(docs) if i in keep]
+    stats = {
+        "clusters": multi,
+        "removed": len(notices) - len(out),
+        "largestCluster": largest,
+        "candidatePairs": candidates,
+        "threshold": NEAR_DUP_THRESHOLD,
+    }
+    return out, stats
+
+
+# 맞춤 점수(support_notice.html calcScore)에 쓰는 특징을 빌드 때 한 번만 계산한다
+REGION_TAGS = ("서울", "부산", "대구", "인천", "광주", "대전", "울산", "세종", "경기",
+               "강원", "충북", "충남", "전북", "전남", "경북", "경남", "제주")
+
+# (비트 이름, 패턴, 검사할 필드) - 비트 위치는 목록 순서
+FEATURE_RULES = [
+    ("stage:예비", re.compile(r"예비"), ("title",)),
+    ("stage:초기", re.compile(r"초기|청년창업사관|창업성공패키지"), ("title",)),
+    ("stage:도약", re.compile(r"도약|스케일|성장"), ("title",)),
+    ("goal:지원금", re.compile(r"지원|보전|자금|융자"), ("title",)),
+    ("goal:판로", re.compile(r"수출|내수|판로|전시|박람"), ("title",)),
+    ("goal:투자", re.compile(r"투자|tips|팁스|ir", re.I), ("title",)),
+    ("field:창업", re.compile(r"창업"), ("title", "category")),
+    ("field:수출", re.compile(r"수출"), ("title", "category")),
+    ("field:기술", re.compile(r"기술"), ("title", "category")),
+    ("field:금융", re.compile(r"금융"), ("title", "category")),
+]
+
+DEADLINE_HHMM_RE = re.compile(r"(?:^|[^0-9])([01]?[0-9]|2[0-3]):([0-5][0-9])(?:[^0-9]|$)")
+DEADLINE_HOUR_RE = re.compile(r"(?:^|[^0-9])([01]?[0-9]|2[0-3])\s*시(?:\s*([0-5]?[0-9])\s*분)?")
+
+
+def parse_deadline_time(n: dict) -> str:
+    # 페이지의 extractDeadlineTime 과 같은 규칙: "18:00" / "18시 30분" / "18시" -> "HH:MM"
+    cand = " | ".join(str(n.get(k) or "") for k in ("deadlineTime", "deadlineText", "period", "title"))
+    m = DEADLINE_HHMM_RE.search(cand)
+    if m:
+        return f"{m.group(1).zfill(2)}:{m.group(2)}"
+    m = DEADLINE_HOUR_RE.search(cand)
+    if m:
+        return f"{m.group(1).zfill(2)}:{(m.group(2) or '00').zfill(2)}"
+    return ""
+
+
+def urgency_bucket(dday) -> int:
+    # 3: D-1 이내, 2: D-3 이내, 1: D-7 이내, 0: 그 외/마감정보 없음
+    if dday is None:
+        return 0
+    if dday <= 1:
+        return 3
+    if dday <= 3:
+        return 2
+    if dday <= 7:
+        return 1
+    return 0
+
+
+def attach_match_features(notices: list) -> dict:
+    """공고마다 regionMask / featureMask(비트), deadlineTime, urgency 를 채운다.
+    비트 순서는 돌려주는 범례(meta["features"])로 페이지에 전달한다."""
+    for n in notices:
+        title = n.get("title") or ""
+        region = 0
+        for i, tag in enumerate(REGION_TAGS):
+            if tag in title:
+                region |= 1 << i
+        feat = 0
+        for i, (_, rx, keys) in enumerate(FEATURE_RULES):
+            if any(rx.search(n.get(k) or "") for k in keys):
+                feat |= 1 << i
+        n["regionMask"] = region
+        n["featureMask"] = feat
+        n["deadlineTime"] = parse_deadline_time(n)
+        n["urgency"] = urgency_bucket(n.get("dday"))
+    return {"regions": list(REGION_TAGS), "bits": [name for name, *_ in FEATURE_RULES]}
+
+
 def sort_key(n: dict):
     # 마감 지난 공고는 아래로, 마감일 없는 공고는 가장 아래로
     dday = n.get("dday")
@@ -593,24 +1303,347 @@ def sort_key(n: dict):
     return (grp, dval, n.get("deadline") or "9999-12-31", -(SOURCE_PRIORITY.get(n.get("source") or "", 0)))
 
 
-def main():
+# 소스 레지스트리: (이름, 파서, 소스별 타임아웃(초), 사용 여부)
+SOURCES = [
+    ("kstartup", parse_kstartup, 240, True),
+    ("bizinfo", parse_bizinfo, 300, True),
+    ("iris", parse_iris, 180, True),
+    ("egbiz", parse_egbiz, 120, True),
+    ("smtech", parse_smtech, 90, True),
+    ("smes24", parse_smes24, 90, True),
+    ("gosims", parse_gosims, 120, True),
+]
+
+
+def run_sources(sources=SOURCES) -> tuple[list, list]:
+    # 사용 중인 모든 파서를 동시에 실행하고, 소스별 타임아웃을 넘긴 결과는 버린다.
+    # 멈춘 포털 때문에 프로세스 종료가 막히지 않도록 데몬 스레드를 사용한다.
+    jobs = []
+    for name, fn, timeout, enabled in sources:
+        if not enabled:
+            continue
+        box = {}
+
+        def run(fn=fn, box=box, name=name):
+            t0 = time.perf_counter()
+            try:
+                with metrics.source(name):
+                    box["data"] = fn()
+            except Exception as e:
+                box["error"] = e
+            metrics.source_done(name, time.perf_counter() - t0, len(box.get("data") or []))
+
+        th = threading.Thread(target=run, name=f"source-{name}", daemon=True)
+        th.start()
+        jobs.append((name, timeout, th, box, time.monotonic()))
+
     all_notices = []
     errs = []
+    for name, timeout, th, box, started in jobs:
+        th.join(max(0.0, started + timeout - time.monotonic()))
+        if th.is_alive():
+            errs.append(f"{name}: timed out after {timeout}s")
+            metrics.source_done(name, float(timeout))
+        elif "error" in box:
+            errs.append(f"{name}: {box['error']}")
+        else:
+            all_notices.extend(box.get("data") or [])
+    return all_notices, errs
+
+
+DATA_DIR = BASE / "data"
+# 마감 버킷: (이름, 최소 D-day, 최대 D-day). 페이지는 d7 을 먼저 받고 나머지는 나중에 받는다.
+DEADLINE_BUCKETS = (("d7", 0, 7), ("d30", 8, 30), ("later", 31, None))
+
+
+def deadline_bucket(n: dict) -> str:
+    dday = n.get("dday")
+    if dday is None:
+        return "none"
+    if dday < 0:
+        return "expired"
+    for name, lo, hi in DEADLINE_BUCKETS:
+        if dday >= lo and (hi is None or dday <= hi):
+            return name
+    return "later"
+
+
+def write_artifact(path: Path, text: str) -> dict:
+    # 원본 + 미리 압축한 .gz(+ brotli 가 있으면 .br) 사본을 쓰고 크기를 돌려준다
+    raw = text.encode("utf-8")
+    path.write_bytes(raw)
+    gz = gzip.compress(raw, compresslevel=9, mtime=0)
+    path.with_name(path.name + ".gz").write_bytes(gz)
+    info = {"file": path.name, "bytes": len(raw), "gz": len(gz)}
+    if brotli is not None:
+        br = brotli.compress(raw, quality=11)
+        path.with_name(path.name + ".br").write_bytes(br)
+        info["br"] = len(br)
+    return info
+
+
+# 컬럼 포맷에서 문자열 사전으로 바꾸는 필드와, id 로 URL 을 다시 만드는 필드
+COLUMNAR_DICT_FIELDS = ("source", "category", "org")
+COLUMNAR_URL_FIELDS = ("url", "originUrl")
+
+
+def id_key(n: dict) -> str:
+    # "b-PBLN_000..." -> "PBLN_000..."
+    nid = n.get("id") or ""
+    return nid.split("-", 1)[1] if "-" in nid else nid
+
+
+def encode_columnar(notices: list) -> dict:
+    """행(dict) 목록을 필드별 배열로 바꾼다.
+    - source/category/org 는 공통 문자열 사전(dict)의 인덱스
+    - url/originUrl 은 소스별 템플릿("{key}" = id 의 접두어 뒤 부분)과 같으면 0, 다르면 원문
+    - 값이 없거나 null 이면 null"""
+    fields = []
+    for n in notices:
+        for k in n:
+            if k not in fields:
+                fields.append(k)
+
+    # 소스별로 가장 흔한 URL 템플릿을 고른다
+    templates = {}
+    for f in COLUMNAR_URL_FIELDS:
+        counts = {}
+        for n in notices:
+            v = n.get(f)
+            if not v:
+                continue
+            key = id_key(n)
+            tmpl = v.replace(key, "{key}") if key else v
+            src = n.get("source") or ""
+            counts.setdefault(src, {})
+            counts[src][tmpl] = counts[src].get(tmpl, 0) + 1
+        for src, c in counts.items():
+            tmpl = max(c, key=c.get)
+            if c[tmpl] > 1:
+                templates.setdefault(f, {})[src] = tmpl
+
+    strings = []
+    string_idx = {}
+    cols = {f: [] for f in fields}
+    for n in notices:
+        key = id_key(n)
+        src = n.get("source") or ""
+        for f in fields:
+            v = n.get(f)
+            if v is None:
+                cols[f].append(None)
+            elif f in COLUMNAR_DICT_FIELDS:
+                if v not in string_idx:
+                    string_idx[v] = len(strings)
+                    strings.append(v)
+                cols[f].append(string_idx[v])
+            elif f in COLUMNAR_URL_FIELDS and templates.get(f, {}).get(src, "\0").replace("{key}", key) == v:
+                cols[f].append(0)
+            else:
+                cols[f].append(v)
+
+    return {"format": "columnar", "v": 1, "n": len(notices), "dict": strings, "templates": templates, "cols": cols}
+
+
+def title_bigrams(title: str) -> set:
+    t = (title or "").lower()
+    return {t[i:i + 2] for i in range(len(t) - 1)}
+
+
+def build_search_index(notices: list) -> dict:
+    """제목 검색용 역색인. positions 는 ids 배열의 위치.
+    - grams: 소문자 제목의 글자 bigram(공백 포함) -> 위치 목록. 부분 문자열 검색은 bigram 교집합 후 includes 로 확인
+    - terms: normalize_title 토큰 -> 위치 목록(단어 단위 검색)"""
+    grams = {}
+    terms = {}
+    for pos, n in enumerate(notices):
+        for g in title_bigrams(n.get("title") or ""):
+            grams.setdefault(g, []).append(pos)
+        for tok in set(normalize_title(n.get("title") or "").split()):
+            terms.setdefault(tok, []).append(pos)
+    return {
+        "ids": [n.get("id") or "" for n in notices],
+        "grams": dict(sorted(grams.items())),
+        "terms": dict(sorted(terms.items())),
+    }
+
+
+# 변경분 피드: 공고 내용 해시를 이전 빌드와 비교해 notices-delta.json 에 추가/변경/삭제 id 를 적는다.
+# dday/urgency 는 날짜만 지나도 바뀌므로 내용 해시에서 뺀다.
+DELTA_PATH = BASE / "notices-delta.json"
+DELTA_VOLATILE = ("dday", "urgency")
+
+
+def content_hash(n: dict) -> str:
+    body = {k: v for k, v in n.items() if k not in DELTA_VOLATILE}
+    return hashlib.sha1(json.dumps(body, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+def data_hash(notices: list) -> str:
+    # 출력 전체(순서, dday 포함)가 같은지 가리는 해시
+    h = hashlib.sha1()
+    for n in notices:
+        h.update(json.dumps(n, ensure_ascii=False, sort_keys=True).encode("utf-8"))
+        h.update(b"\n")
+    return h.hexdigest()
+
+
+def compute_delta(prev_notices: list, notices: list, failed=(), prev_unavailable=None) -> dict:
+    """이전 빌드 대비 added/changed/removed id 와 바뀐 공고의 해시.
+    이번에 실패/타임아웃된 소스(failed)의 공고는 removed 대신 unavailable({id: {hash, source}})로 남기고,
+    다음 빌드는 이전 unavailable 도 이전 공고로 쳐서 소스가 돌아왔을 때 added 로 다시 나오지 않게 한다."""
+    old = {n["id"]: {"hash": content_hash(n), "source": n.get("source") or ""} for n in prev_notices if n.get("id")}
+    for i, v in (prev_unavailable or {}).items():
+        old.setdefault(i, v)
+    new = {n["id"]: content_hash(n) for n in notices if n.get("id")}
+    added = [i for i in new if i not in old]
+    changed = [i for i in new if i in old and old[i]["hash"] != new[i]]
+    unavailable = {i: v for i, v in old.items() if i not in new and v["source"] in failed}
+    removed = [i for i in old if i not in new and i not in unavailable]
+    return {
+        "added": added,
+        "changed": changed,
+        "removed": removed,
+        "unavailable": unavailable,
+        "hashes": {i: new[i] for i in added + changed},
+    }
+
 
-    for name, fn in [
-        ("kstartup", parse_kstartup),
-        ("bizinfo", parse_bizinfo),
-        ("iris", parse_iris),
-    ]:
-        try:
-            data = fn()
-            all_notices.extend(data)
-        except Exception as e:
-            errs.append(f"{name}: {e}")
+def next_build_seq(prev_meta: dict) -> int:
+    # notices.json 과 notices-delta.json 중 큰 값 + 1 (둘 중 하나만 남아 있어도 줄어들지 않게)
+    seq = prev_meta.get("buildSeq") or 0
+    seq = max(seq, load_snapshot(DELTA_PATH).get("seq") or 0)
+    return seq + 1
+
+
+def write_delta(meta: dict, prev_meta: dict, delta: dict):
+    out = {
+        "seq": meta["buildSeq"],
+        "prevSeq": prev_meta.get("buildSeq"),
+        "updatedAt": meta["updatedAt"],
+        "prevUpdatedAt": prev_meta.get("updatedAt"),
+        "count": meta["count"],
+        **delta,
+    }
+    DELTA_PATH.write_text(json.dumps(out, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+
+def write_outputs(meta: dict, notices: list, compact: bool = False) -> dict:
+    """공고마다 JSON 을 한 번만 직렬화해 두고 notices.json / notices.js / data/ 샤드에 그대로 이어 붙인다.
+    compact 면 data/ 샤드를 컬럼 포맷(encode_columnar)으로 쓴다.
+    data/index.json 에는 메타데이터와 샤드 목록(파일/건수/크기)을 적는다."""
+    enc = [json.dumps(n, ensure_ascii=False) for n in notices]
+
+    head = json.dumps(meta, ensure_ascii=False, indent=2)[:-2]
+    (BASE / "notices.json").write_text(
+        head + ',\n  "notices": [\n    ' + ",\n    ".join(enc) + "\n  ]\n}\n",
+        encoding="utf-8",
+    )
+    (BASE / "notices.js").write_text(
+        "window.GOV_DATA = " + json.dumps(meta, ensure_ascii=False)[:-1] + ', "notices": [' + ", ".join(enc) + "]};\n",
+        encoding="utf-8",
+    )
+
+    groups = {"deadline": {}, "source": {}}
+    for name in [b[0] for b in DEADLINE_BUCKETS] + ["none", "expired"]:
+        groups["deadline"][name] = []
+    for name, *_ in SOURCES:
+        groups["source"][name] = []
+    for i, n in enumerate(notices):
+        groups["deadline"][deadline_bucket(n)].append(i)
+        groups["source"].setdefault(n.get("source") or "unknown", []).append(i)
+
+    DATA_DIR.mkdir(exist_ok=True)
+    shards = {}
+    for kind, buckets in groups.items():
+        shards[kind] = {}
+        for name, idx in buckets.items():
+            if compact:
+                text = json.dumps(encode_columnar([notices[i] for i in idx]), ensure_ascii=False, separators=(",", ":"))
+            else:
+                text = "[" + ",".join(enc[i] for i in idx) + "]"
+            info = write_artifact(DATA_DIR / f"{kind}-{name}.json", text)
+            info["count"] = len(idx)
+            shards[kind][name] = info
+
+    search = write_artifact(DATA_DIR / "search-index.json", json.dumps(build_search_index(notices), ensure_ascii=False, separators=(",", ":")))
+
+    index = {
+        **meta,
+        # 메타의 다른 키와 겹치지 않게 샤드 포맷은 shardFormat 으로 둔다(index.json 자체는 항상 일반 JSON)
+        "shardFormat": "columnar" if compact else "rows",
+        "shards": shards,
+        "firstShard": "deadline-d7.json",
+        "searchIndex": search,
+    }
+    write_artifact(DATA_DIR / "index.json", json.dumps(index, ensure_ascii=False))
+    return index
+
+
+def main():
+    ap = argparse.ArgumentParser(description="정부지원사업 공고 수집 후 notices.json / notices.js 생성")
+    ap.add_argument("--full", action="store_true", help="이전 결과를 무시하고 상세페이지를 모두 다시 수집")
+    ap.add_argument("--compact", action="store_true", help="data/ 샤드를 컬럼(사전 인코딩) 포맷으로 저장")
+    ap.add_argument("--profile", metavar="PREFIX", nargs="?", const="build-profile",
+                    help="cProfile(PREFIX.prof)과 flamegraph 용 스택 샘플(PREFIX.folded) 저장. "
+                         "cProfile 은 3.11 이하에선 스레드마다 따로 켜서 합치고, 3.12 이상에선 하나로 전체를 잰다")
+    tape = ap.add_mutually_exclusive_group()
+    tape.add_argument("--record", metavar="CASSETTE", help="get/post_text 요청과 응답을 카세트(gzip JSON Lines)로 녹화")
+    tape.add_argument("--replay", metavar="CASSETTE", help="네트워크 대신 카세트로 응답(녹화에 없는 요청은 실패)")
+    ap.add_argument("--replay-latency", type=float, default=0.0, metavar="FACTOR",
+                    help="재생 때 녹화된 요청 소요 시간 x FACTOR 만큼 기다림(기본 0: 기다리지 않음)")
+    ap.add_argument("--out-dir", help="notices.json / notices.js / data/ 를 쓸 디렉터리(기본: 저장소 루트)")
+    args = ap.parse_args()
+
+    global CASSETTE, HOST_DELAY, BASE, DATA_DIR, DELTA_PATH
+    if args.out_dir:
+        BASE = Path(args.out_dir).resolve()
+        BASE.mkdir(parents=True, exist_ok=True)
+        DATA_DIR = BASE / "data"
+        DELTA_PATH = BASE / "notices-delta.json"
+    if args.record:
+        # 녹화본이 실제 포털 응답을 담도록 디스크 캐시를 건너뛴다
+        cache.enabled = False
+        CASSETTE = Cassette(args.record)
+    elif args.replay:
+        CASSETTE = Cassette(args.replay, replaying=True, latency=args.replay_latency)
+        if not args.replay_latency:
+            HOST_DELAY = 0.0
+
+    try:
+        if not args.profile:
+            build(args)
+            return
+        with BuildProfiler() as prof:
+            build(args)
+        print("profile:", ", ".join(prof.dump(args.profile)))
+    finally:
+        if args.record:
+            print(f"cassette: {CASSETTE.save()} requests -> {args.record}")
+
+
+def build(args):
+    global PREVIOUS
+    snapshot = load_snapshot(BASE / "notices.json")
+    prev_notices = snapshot.pop("notices", [])
+    # 녹화/재생은 상세페이지 요청까지 매번 같아야 하므로 항상 전체 빌드로 돈다
+    full = args.full or CASSETTE is not None
+    PREVIOUS = {} if full else {n["id"]: n for n in prev_notices if n.get("id")}
+
+    with metrics.stage("sources"):
+        all_notices, errs = run_sources()
+    client.close()
+    cache.evict()
 
     before_count = len(all_notices)
-    all_notices, dedup_removed = dedupe_notices(all_notices)
-    all_notices.sort(key=sort_key)
+    with metrics.stage("dedupe"):
+        all_notices, dedup_removed = dedupe_notices(all_notices)
+    with metrics.stage("nearDup"):
+        all_notices, near_dup_stats = cluster_near_duplicates(all_notices)
+    with metrics.stage("sort"):
+        all_notices.sort(key=sort_key)
+    with metrics.stage("features"):
+        features = attach_match_features(all_notices)
 
     source_stats = {}
     for n in all_notices:
@@ -619,23 +1652,44 @@ def main():
 
     no_deadline_count = sum(1 for n in all_notices if not n.get("deadline"))
 
-    payload = {
+    digest = data_hash(all_notices)
+    if digest == snapshot.get("dataHash"):
+        print(f"no changes in {len(all_notices)} notices (build #{snapshot.get('buildSeq')}); outputs left as is")
+        print(f"http cache: hit {cache.hits} / 304 {cache.revalidated} / miss {cache.misses}")
+        print("\n".join(metrics.summary_lines()))
+        if errs:
+            print("errors:", " | ".join(errs))
+        return
+
+    # errors 항목은 "소스: 메시지" 형식
+    failed = {e.split(":", 1)[0] for e in errs}
+    delta = compute_delta(prev_notices, all_notices, failed, load_snapshot(DELTA_PATH).get("unavailable"))
+    meta = {
         "updatedAt": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "buildSeq": next_build_seq(snapshot),
+        "dataHash": digest,
         "count": len(all_notices),
         "beforeDedupeCount": before_count,
         "dedupRemoved": dedup_removed,
+        "nearDupStats": near_dup_stats,
         "noDeadlineCount": no_deadline_count,
         "sourceStats": source_stats,
+        "detailStats": detail_stats,
+        "features": features,
         "errors": errs,
-        "notices": all_notices,
     }
-
-    (BASE / "notices.json").write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
-    (BASE / "notices.js").write_text(
-        "window.GOV_DATA = " + json.dumps(payload, ensure_ascii=False) + ";\n",
-        encoding="utf-8",
-    )
-    print(f"saved {len(all_notices)} notices (dedupe -{dedup_removed})")
+    with metrics.stage("write"):
+        # 쓰기 단계 자체의 시간은 payload 에는 없고 콘솔 요약에만 나온다
+        meta["metrics"] = metrics.to_dict()
+        write_outputs(meta, all_notices, compact=args.compact)
+        write_delta(meta, snapshot, delta)
+
+    print(f"saved {len(all_notices)} notices (dedupe -{dedup_removed}, near-dup -{near_dup_stats['removed']} in {near_dup_stats['clusters']} clusters)")
+    print(f"build #{meta['buildSeq']}: +{len(delta['added'])} ~{len(delta['changed'])} -{len(delta['removed'])}"
+          f" (unavailable {len(delta['unavailable'])})")
+    print(f"detail pages: fetched {detail_stats['fetched']} / reused {detail_stats['reused']} / failed {detail_stats['failed']}")
+    print(f"http cache: hit {cache.hits} / 304 {cache.revalidated} / miss {cache.misses}")
+    print("\n".join(metrics.summary_lines()))
     if errs:
         print("errors:", " | ".join(errs))
 
@@ -1,16 +1,10 @@
 import requests
 
-NOTION_TOKEN = "os.environ.get("NOTION_TOKEN")"
+from notion_api import notion
+
 PARENT_PAGE_ID = "3129979fd60d80b4b97bd7ad44e2189d"
 
 def create_patch_note_db():
-    url = "https://api.notion.com/v1/databases"
-    headers = {
-        "Authorization": f"Bearer {NOTION_TOKEN}",
-        "Content-Type": "application/json",
-        "Notion-Version": "2022-06-28"
-    }
-    
     data = {
         "parent": { "type": "page_id", "page_id": PARENT_PAGE_ID },
         "title": [
@@ -42,16 +36,15 @@ def create_patch_note_db():
         }
     }
     
-    response = requests.post(url, headers=headers, json=data)
-    if response.status_code == 200:
-        db_id = response.json().get("id")
-        print(f"✅ 독스헌트 AI 패치노트 데이터베이스 생성 성공!")
-        print(f"📌 신규 Database ID: {db_id}")
-        return db_id
-    else:
-        print(f"❌ 생성 실패: {response.status_code}")
-        print(response.text)
+    try:
+        db_id = notion.post("/databases", data).get("id")
+    except requests.HTTPError as e:
+        print(f"❌ 생성 실패: {e.response.status_code}")
+        print(e.response.text)
         return None
+    print(f"✅ 독스헌트 AI 패치노트 데이터베이스 생성 성공!")
+    print(f"📌 신규 Database ID: {db_id}")
+    return db_id
 
 if __name__ == "__main__":
     create_patch_note_db()
@@ -1,77 +1,148 @@
 import requests
 import json
 import os
-from datetime import datetime
+import sys
+import hashlib
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from notion_api import notion
 
-NOTION_TOKEN = os.environ.get("NOTION_TOKEN")
 DATABASE_ID = os.environ.get("NOTION_DB_ID", "3129979fd60d81cc8e99cb28f8f8c5e1")
 
-def fetch_notion_patches():
-    url = f"https://api.notion.com/v1/databases/{DATABASE_ID}/query"
-    headers = {
-        "Authorization": f"Bearer {NOTION_TOKEN}",
-        "Content-Type": "application/json",
-        "Notion-Version": "2022-06-28"
-    }
-    
+BASE = Path(__file__).resolve().parent
+PATCHES_PATH = BASE / "patches.json"
+# 페이지 id -> 추출한 패치 정보. 마지막 동기화 이후 수정된 페이지만 받아 여기에 합친다.
+STORE_PATH = Path(os.environ.get("NOTION_PATCH_STORE", BASE / "patch_store.json"))
+# 노션 last_edited_time 은 분 단위라 직전 동기화 시각보다 조금 앞에서부터 다시 받는다
+SYNC_OVERLAP = timedelta(minutes=5)
+
+
+def query_database(since=None):
+    """데이터베이스를 start_cursor 로 끝까지 조회한다. since 가 있으면 그 뒤에 수정된 페이지만."""
     payload = {
         "sorts": [ { "property": "날짜", "direction": "descending" } ],
-        "page_size": 20
     }
-    
-    res = requests.post(url, headers=headers, json=payload)
-    if res.status_code != 200:
-        return []
-
-    results = res.json().get("results", [])
-    patches = []
-    
-    for page in results:
-        props = page.get("properties", {})
-        
-        # 초안전 데이터 추출기
-        def safe_get(p_name, p_type):
-            prop = props.get(p_name, {})
-            if not prop: return ""
-            
-            if p_type == "title":
-                items = prop.get("title", [])
-                return items[0].get("plain_text", "") if items else ""
-            if p_type == "date":
-                return (prop.get("date") or {}).get("start", "")
-            if p_type == "select":
-                return (prop.get("select") or {}).get("name", "기타")
-            if p_type == "rich_text":
-                items = prop.get("rich_text", [])
-                return items[0].get("plain_text", "") if items else ""
-            return ""
-
-        title = safe_get("업데이트명", "title")
-        date = safe_get("날짜", "date")
-        category = safe_get("분류", "select")
-        version = safe_get("버전", "rich_text")
-        status = safe_get("상태", "select")
-        
-        # '배포 완료' 상태이거나 상태가 없으면 추가
-        if "배포" in status or status == "" or "✅" in status:
-            patches.append({
-                "id": page.get("id"),
-                "title": title,
-                "date": date,
-                "category": category,
-                "version": version or "-",
-                "url": f"https://www.notion.so/{page.get('id').replace('-', '')}"
-            })
-            
+    if since:
+        payload["filter"] = {
+            "timestamp": "last_edited_time",
+            "last_edited_time": { "on_or_after": since }
+        }
+    return notion.iter_query(DATABASE_ID, payload)
+
+
+def parse_page(page):
+    props = page.get("properties", {})
+
+    # 초안전 데이터 추출기
+    def safe_get(p_name, p_type):
+        prop = props.get(p_name, {})
+        if not prop: return ""
+
+        if p_type == "title":
+            items = prop.get("title", [])
+            return items[0].get("plain_text", "") if items else ""
+        if p_type == "date":
+            return (prop.get("date") or {}).get("start", "")
+        if p_type == "select":
+            return (prop.get("select") or {}).get("name", "기타")
+        if p_type == "rich_text":
+            items = prop.get("rich_text", [])
+            return items[0].get("plain_text", "") if items else ""
+        return ""
+
+    return {
+        "id": page.get("id"),
+        "title": safe_get("업데이트명", "title"),
+        "date": safe_get("날짜", "date"),
+        "category": safe_get("분류", "select"),
+        "version": safe_get("버전", "rich_text") or "-",
+        "status": safe_get("상태", "select"),
+        "url": f"https://www.notion.so/{page.get('id').replace('-', '')}"
+    }
+
+
+def is_released(p):
+    # '배포 완료' 상태이거나 상태가 없으면 추가
+    status = p.get("status") or ""
+    return "배포" in status or status == "" or "✅" in status
+
+
+def load_store():
+    try:
+        store = json.loads(STORE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {"pages": {}}
+    if store.get("databaseId") != DATABASE_ID:
+        return {"pages": {}}
+    return store
+
+
+def save_store(store):
+    tmp = STORE_PATH.with_suffix(".tmp")
+    tmp.write_text(json.dumps(store, ensure_ascii=False, indent=1) + "\n", encoding="utf-8")
+    tmp.replace(STORE_PATH)
+
+
+def fetch_notion_patches(full=False):
+    """저장소를 갱신하고 배포된 패치 목록(날짜 내림차순)을 돌려준다.
+    full 이면 처음부터 다시 받는다(노션에서 지운 페이지는 전체 조회 때만 빠진다)."""
+    store = {"pages": {}} if full else load_store()
+    started = datetime.now(timezone.utc)
+
+    since = None
+    if store.get("syncedAt"):
+        since = (datetime.fromisoformat(store["syncedAt"]) - SYNC_OVERLAP).isoformat()
+
+    pages = {} if since is None else store["pages"]
+    changed = 0
+    for page in query_database(since):
+        if page.get("archived") or page.get("in_trash"):
+            changed += pages.pop(page["id"], None) is not None
+            continue
+        p = parse_page(page)
+        if pages.get(p["id"]) != p:
+            pages[p["id"]] = p
+            changed += 1
+
+    save_store({
+        "databaseId": DATABASE_ID,
+        "syncedAt": started.isoformat(),
+        "pages": pages,
+    })
+    print(f"{'증분' if since else '전체'} 조회: 변경 {changed}건 / 저장 {len(pages)}건")
+
+    patches = [{k: v for k, v in p.items() if k != "status"} for p in pages.values() if is_released(p)]
+    patches.sort(key=lambda p: (p["date"] or "", p["version"]), reverse=True)
     return patches
 
+
+def patches_hash(patches):
+    return hashlib.sha1(json.dumps(patches, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()
+
+
 if __name__ == "__main__":
     print("🔄 노션 최신 패치노트 로드...")
-    data = fetch_notion_patches()
+    try:
+        data = fetch_notion_patches(full="--full" in sys.argv)
+    except requests.RequestException as e:
+        # 실패하면 기존 patches.json 을 그대로 둔다
+        print(f"❌ 노션 조회 실패: {e}")
+        sys.exit(1)
+    print(notion.summary())
+
+    try:
+        old = json.loads(PATCHES_PATH.read_text(encoding="utf-8")).get("patches")
+    except (OSError, ValueError):
+        old = None
+    if old is not None and patches_hash(old) == patches_hash(data):
+        print(f"✅ 변경 없음, patches.json 유지 (총 {len(data)}건)")
+        sys.exit(0)
+
     output = {
         "updatedAt": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         "patches": data
     }
-    with open("patches.json", "w", encoding="utf-8") as f:
+    with open(PATCHES_PATH, "w", encoding="utf-8") as f:
         json.dump(output, f, ensure_ascii=False, indent=2)
     print(f"✅ patches.json 생성 성공! (총 {len(data)}건)")
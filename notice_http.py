@@ -0,0 +1,508 @@
+#!/usr/bin/env python3
+# build_notices.py 의 HTTP 계층
+# - 호스트별 keep-alive 커넥션 풀 + gzip/deflate 해제 + 재시도(지수 백오프/지터, Retry-After)
+# - 디스크 응답 캐시(ETag/Last-Modified 조건부 요청)
+# - 녹화/재생용 카세트(요청별 응답 본문과 소요 시간을 gzip JSON Lines 로 저장)
+import base64, gzip, hashlib, http.client, json, os, random, ssl, threading, time, zlib
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from urllib.error import HTTPError
+from urllib.parse import urljoin, urlsplit
+
+BASE = Path(__file__).resolve().parent
+
+CACHE_DIR = Path(os.environ.get("NOTICE_HTTP_CACHE_DIR") or BASE / ".cache" / "http")
+CACHE_ENABLED = os.environ.get("NOTICE_HTTP_CACHE", "on").lower() not in ("0", "off", "false", "no")
+CACHE_MAX_BYTES = int(os.environ.get("NOTICE_HTTP_CACHE_MAX_MB", "200")) * 1024 * 1024
+
+# 소스(호스트)별 TTL(초): TTL 안에서는 네트워크 없이 캐시로 응답하고,
+# 지나면 If-None-Match / If-Modified-Since 로 재검증한다.
+# 목록 페이지는 매시간 재검증되도록 1시간보다 짧게 잡는다.
+CACHE_TTL = {
+    "www.k-startup.go.kr": 30 * 60,
+    "www.bizinfo.go.kr": 30 * 60,
+    "www.iris.go.kr": 30 * 60,
+    "www.egbiz.or.kr": 30 * 60,
+    "www.smtech.go.kr": 30 * 60,
+    "www.smes.go.kr": 30 * 60,
+    "www.bojo.go.kr": 30 * 60,
+}
+DEFAULT_TTL = 10 * 60
+# 상세페이지는 게시 후 거의 바뀌지 않아 길게 둔다.
+DETAIL_TTL = 12 * 60 * 60
+
+
+REQUEST_TIMEOUT = 20
+MAX_RETRIES = 3
+BACKOFF_BASE = 0.5  # 초, 시도마다 2배
+BACKOFF_MAX = 30.0
+POOL_SIZE = 8  # 호스트당 유지할 유휴 커넥션 수
+MAX_REDIRECTS = 5
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class Response:
+    def __init__(self, url: str, status: int, reason: str, headers, body: bytes, stream=None):
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.body = body
+        # 스트리밍 응답이면 (client, origin, conn, http.client.HTTPResponse)
+        self._stream = stream
+
+    def text(self) -> str:
+        return self.body.decode("utf-8", errors="ignore")
+
+    def iter_content(self, size: int = 16 * 1024):
+        # 본문을 조각 단위로 받아 압축을 풀어 돌려준다. 끝까지 읽으면 커넥션을 풀에 반납한다.
+        if self._stream is None:
+            # 이미 메모리에 있는 본문(카세트 재생 등)은 같은 크기로 잘라 돌려준다
+            for i in range(0, len(self.body or b""), size):
+                yield self.body[i:i + size]
+            return
+        client, origin, conn, r = self._stream
+        decomp = Decompressor(r.headers.get("Content-Encoding"))
+        while True:
+            try:
+                chunk = r.read(size)
+            except Exception:
+                self.close()
+                raise
+            if not chunk:
+                break
+            data = decomp.decompress(chunk)
+            if data:
+                yield data
+        tail = decomp.flush()
+        if tail:
+            yield tail
+        self._stream = None
+        client._finish(origin, conn, r)
+
+    def close(self) -> None:
+        # 본문을 다 읽지 않고 닫으면 커넥션은 재사용할 수 없으므로 버린다(본문 없는 304 는 반납).
+        if self._stream:
+            client, origin, conn, r = self._stream
+            self._stream = None
+            if self.status in (204, 304):
+                client._finish(origin, conn, r)
+            else:
+                conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class Decompressor:
+    # Content-Encoding(gzip/deflate)을 조각 단위로 해제
+    def __init__(self, encoding: str):
+        encoding = (encoding or "").strip().lower()
+        self.encoding = encoding
+        self.obj = None
+        if encoding in ("gzip", "x-gzip"):
+            self.obj = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    def decompress(self, chunk: bytes) -> bytes:
+        if self.encoding == "deflate" and self.obj is None:
+            # zlib 래퍼가 있는 경우와 raw deflate 둘 다 허용
+            self.obj = zlib.decompressobj()
+            try:
+                return self.obj.decompress(chunk)
+            except zlib.error:
+                self.obj = zlib.decompressobj(-zlib.MAX_WBITS)
+        if self.obj is None:
+            return chunk
+        return self.obj.decompress(chunk)
+
+    def flush(self) -> bytes:
+        return self.obj.flush() if self.obj else b""
+
+
+def decode_body(body: bytes, encoding: str) -> bytes:
+    d = Decompressor(encoding)
+    return d.decompress(body) + d.flush()
+
+
+def retry_after(headers) -> float:
+    value = (headers.get("Retry-After") or "").strip() if headers else ""
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, headers=None) -> float:
+    wait = retry_after(headers)
+    if wait is None:
+        wait = BACKOFF_BASE * (2 ** attempt)
+        wait += random.uniform(0, wait)
+    return min(wait, BACKOFF_MAX)
+
+
+class HttpClient:
+    # (scheme, host, port)별 유휴 커넥션을 재사용해 TCP/TLS 핸드셰이크를 한 번만 치른다.
+    def __init__(self, pool_size: int = POOL_SIZE, timeout: float = REQUEST_TIMEOUT, retries: int = MAX_RETRIES):
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.retries = retries
+        self.ssl_context = ssl.create_default_context()
+        self.lock = threading.Lock()
+        self.idle = {}
+        # 스레드별 재시도 횟수(계측용, take_retries 로 읽고 비운다)
+        self.local = threading.local()
+
+    def _connect(self, origin: tuple):
+        scheme, host, port = origin
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=self.timeout, context=self.ssl_context)
+        return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    def _acquire(self, origin: tuple):
+        with self.lock:
+            conns = self.idle.get(origin)
+            if conns:
+                return conns.pop(), True
+        return self._connect(origin), False
+
+    def _release(self, origin: tuple, conn) -> None:
+        with self.lock:
+            conns = self.idle.setdefault(origin, [])
+            if len(conns) < self.pool_size:
+                conns.append(conn)
+                return
+        conn.close()
+
+    def take_retries(self) -> int:
+        n = getattr(self.local, "retries", 0)
+        self.local.retries = 0
+        return n
+
+    def _note_retry(self) -> None:
+        self.local.retries = getattr(self.local, "retries", 0) + 1
+
+    def close(self) -> None:
+        with self.lock:
+            conns = [c for cs in self.idle.values() for c in cs]
+            self.idle.clear()
+        for c in conns:
+            c.close()
+
+    def _send(self, method: str, url: str, body, headers: dict, stream: bool = False) -> Response:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        port = parts.port or (443 if scheme == "https" else 80)
+        origin = (scheme, parts.hostname, port)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        conn, reused = self._acquire(origin)
+        try:
+            r = self._roundtrip(conn, method, path, body, headers)
+        except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+            if not reused:
+                raise
+            # 서버가 이미 닫은 유휴 커넥션이었으면 새 커넥션으로 한 번 더
+            conn = self._connect(origin)
+            r = self._roundtrip(conn, method, path, body, headers)
+
+        if stream:
+            return Response(url, r.status, r.reason, r.headers, None, (self, origin, conn, r))
+        try:
+            raw = r.read()
+        except Exception:
+            conn.close()
+            raise
+        self._finish(origin, conn, r)
+        return Response(url, r.status, r.reason, r.headers, decode_body(raw, r.headers.get("Content-Encoding")))
+
+    def _roundtrip(self, conn, method: str, path: str, body, headers: dict):
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            return conn.getresponse()
+        except Exception:
+            conn.close()
+            raise
+
+    def _finish(self, origin: tuple, conn, r) -> None:
+        if r.will_close:
+            conn.close()
+        else:
+            self._release(origin, conn)
+
+    def request(self, method: str, url: str, body: bytes = None, headers: dict = None, stream: bool = False) -> Response:
+        """요청을 보내고 응답을 돌려준다. 타임아웃/연결 오류/429·5xx 는 백오프 후 재시도하며,
+        304 를 제외한 4xx·5xx 최종 응답은 HTTPError 로 올린다. 리다이렉트는 따라간다.
+        stream=True 면 본문을 읽지 않은 응답을 돌려주므로 iter_content()/close() 로 처리한다."""
+        headers = dict(headers or {})
+        headers.setdefault("Accept-Encoding", "gzip, deflate")
+        headers.setdefault("Connection", "keep-alive")
+
+        for _ in range(MAX_REDIRECTS + 1):
+            r = self._request_with_retry(method, url, body, headers, stream)
+            if r.status in (301, 302, 303, 307, 308) and r.headers.get("Location"):
+                r.close()
+                url = urljoin(url, r.headers["Location"])
+                if r.status == 303 or (r.status in (301, 302) and method == "POST"):
+                    method, body = "GET", None
+                    headers.pop("Content-Type", None)
+                continue
+            if r.status >= 400:
+                r.close()
+                raise HTTPError(url, r.status, r.reason, r.headers, None)
+            return r
+        raise HTTPError(url, r.status, "too many redirects", r.headers, None)
+
+    def _request_with_retry(self, method: str, url: str, body, headers: dict, stream: bool = False) -> Response:
+        attempt = 0
+        while True:
+            try:
+                r = self._send(method, url, body, headers, stream)
+            except ssl.SSLCertVerificationError:
+                raise
+            except (OSError, http.client.HTTPException):
+                if attempt >= self.retries:
+                    raise
+                time.sleep(backoff_delay(attempt))
+                self._note_retry()
+                attempt += 1
+                continue
+            if r.status in RETRY_STATUS and attempt < self.retries:
+                r.close()
+                time.sleep(backoff_delay(attempt, r.headers))
+                self._note_retry()
+                attempt += 1
+                continue
+            return r
+
+
+client = HttpClient()
+
+
+def ttl_for(url: str) -> int:
+    return CACHE_TTL.get(urlsplit(url).netloc, DEFAULT_TTL)
+
+
+def cache_key(method: str, url: str, body: bytes = b"") -> str:
+    h = hashlib.sha1()
+    h.update(method.encode("ascii"))
+    h.update(b"\0")
+    h.update(url.encode("utf-8"))
+    h.update(b"\0")
+    h.update(body or b"")
+    return h.hexdigest()
+
+
+class ResponseCache:
+    # 요청(메서드+URL+POST 본문)별 응답 본문과 검증자(ETag/Last-Modified)를 gzip JSON 파일로 저장
+    def __init__(self, root: Path = CACHE_DIR, max_bytes: int = CACHE_MAX_BYTES, enabled: bool = CACHE_ENABLED):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json.gz"
+
+    def load(self, key: str):
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                entry = json.load(f)
+            os.utime(path)
+            return entry
+        except (OSError, ValueError):
+            return None
+
+    def fresh(self, entry, ttl: int) -> bool:
+        return bool(entry) and time.time() - entry.get("storedAt", 0) < ttl
+
+    def store(self, key: str, url: str, body: str, headers) -> None:
+        if not self.enabled:
+            return
+        entry = {
+            "url": url,
+            "storedAt": time.time(),
+            "etag": headers.get("ETag") or "",
+            "lastModified": headers.get("Last-Modified") or "",
+            "body": body,
+        }
+        self._write(key, entry)
+
+    def touch(self, key: str, entry: dict) -> None:
+        # 304 응답: 본문은 그대로 두고 저장 시각만 갱신
+        entry["storedAt"] = time.time()
+        self._write(key, entry)
+
+    def _write(self, key: str, entry: dict) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+    def conditional_headers(self, entry) -> dict:
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("lastModified"):
+            headers["If-Modified-Since"] = entry["lastModified"]
+        return headers
+
+    def count(self, kind: str) -> None:
+        with self.lock:
+            setattr(self, kind, getattr(self, kind) + 1)
+
+    def evict(self) -> int:
+        # 용량 초과 시 가장 오래 쓰이지 않은(mtime 기준) 파일부터 삭제
+        if not self.enabled or not self.root.exists():
+            return 0
+        files = []
+        total = 0
+        for p in self.root.glob("*/*.json.gz"):
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, p))
+            total += st.st_size
+        removed = 0
+        files.sort()
+        for _, size, p in files:
+            if total <= self.max_bytes:
+                break
+            try:
+                p.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
+
+
+cache = ResponseCache()
+
+
+class ReplayError(Exception):
+    pass
+
+
+class Cassette:
+    # 요청 키(cache_key)마다 응답을 받은 순서대로 쌓아 두는 녹화본.
+    # 파일은 gzip JSON Lines: 첫 줄은 헤더, 이후 한 줄에 요청 하나.
+    # 같은 키가 여러 번 오면 녹화 순서대로 돌려주고, 다 쓰면 마지막 응답을 계속 돌려준다.
+    VERSION = 1
+
+    def __init__(self, path, replaying: bool = False, latency: float = 0.0):
+        self.path = Path(path)
+        self.replaying = replaying
+        self.latency = latency  # 재생 때 녹화된 소요 시간에 곱할 배율(0 이면 기다리지 않음)
+        self.lock = threading.Lock()
+        self.entries = {}
+        self.order = []
+        self.cursor = {}
+        if replaying:
+            self._load()
+
+    def _load(self) -> None:
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            head = json.loads(f.readline())
+            if head.get("version") != self.VERSION:
+                raise ReplayError(f"{self.path}: unsupported cassette version {head.get('version')}")
+            for line in f:
+                e = json.loads(line)
+                self.entries.setdefault(e["key"], []).append(e)
+
+    def record(self, key: str, method: str, url: str, body: bytes, text: str, seconds: float, error=None, raw: bytes = None) -> None:
+        # raw: 스트리밍 요청의 압축 해제된 원문(RecordingReader). 재생 때 read 에 다시 흘려 넣는다
+        e = {"key": key, "method": method, "url": url, "seconds": round(seconds, 4)}
+        if body:
+            e["body"] = body.decode("utf-8", errors="replace")
+        if error is not None:
+            e["error"] = f"{type(error).__name__}: {error}"
+        else:
+            e["text"] = text
+            if raw is not None:
+                e["raw"] = base64.b64encode(raw).decode("ascii")
+        with self.lock:
+            self.order.append(e)
+
+    def play(self, key: str, url: str) -> tuple:
+        """(녹화된 응답 텍스트, 스트리밍 요청이면 원문 bytes 아니면 None)"""
+        with self.lock:
+            seq = self.entries.get(key)
+            if not seq:
+                raise ReplayError(f"not in cassette: {url}")
+            i = self.cursor.get(key, 0)
+            self.cursor[key] = i + 1
+            e = seq[min(i, len(seq) - 1)]
+        if self.latency:
+            time.sleep(e["seconds"] * self.latency)
+        if "error" in e:
+            raise ReplayError(f"recorded failure: {e['error']}")
+        return e["text"], base64.b64decode(e["raw"]) if "raw" in e else None
+
+    def save(self) -> int:
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with self.lock:
+            entries = list(self.order)
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            f.write(json.dumps({"version": self.VERSION, "recordedAt": time.strftime("%Y-%m-%d %H:%M:%S"),
+                                "requests": len(entries)}) + "\n")
+            for e in entries:
+                f.write(json.dumps(e, ensure_ascii=False) + "\n")
+        os.replace(tmp, self.path)
+        return len(entries)
+
+
+class RecordingReader:
+    # 녹화 모드에서 스트리밍 응답용 read(response) 를 감싼다. read 에는 조각을 그대로 넘기면서
+    # 압축 해제된 원문을 limit 바이트까지 모은다. read 가 일찍 멈췄어도 limit 까지는 마저 받아 두어
+    # 재생 때 파서/조기 종료 조건이 바뀌어도 같은 원문으로 다시 돌려 볼 수 있게 한다.
+    def __init__(self, read, limit: int):
+        self.read = read
+        self.limit = limit
+        self.parts = []
+        self.size = 0
+        self.chunks = None
+        self.response = None
+
+    def __call__(self, r) -> str:
+        self.response = r
+        txt = self.read(self)
+        if self.chunks is not None:
+            for chunk in self.chunks:
+                if self.size >= self.limit:
+                    break
+                self._keep(chunk)
+        return txt
+
+    def iter_content(self, size: int = 16 * 1024):
+        self.chunks = self.response.iter_content(size)
+        for chunk in self.chunks:
+            self._keep(chunk)
+            yield chunk
+
+    def _keep(self, chunk: bytes) -> None:
+        # 조각 단위로 자르지 않고 모아 재생 때도 같은 경계에서 예산 검사가 걸리게 한다
+        if self.size < self.limit:
+            self.parts.append(chunk)
+            self.size += len(chunk)
+
+    @property
+    def raw(self) -> bytes:
+        return b"".join(self.parts)
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# build_notices.py 의 계측
+# - 소스별 요청 수/바이트/지연 분위수/재시도/캐시 결과와 가장 느린 요청, 단계별 소요 시간
+# - --profile: 모든 스레드를 cProfile 로 재고(.prof), 스택 샘플을 flamegraph 용 folded 형식(.folded)으로 저장
+import cProfile, heapq, pstats, sys, threading, time
+from collections import Counter
+from contextlib import contextmanager
+
+SLOWEST_KEEP = 3  # 소스마다 남길 가장 느린 요청 수
+SAMPLE_INTERVAL = 0.005  # 스택 샘플 간격(초)
+
+
+def percentile(sorted_vals: list, q: float) -> float:
+    # nearest-rank
+    if not sorted_vals:
+        return None
+    return sorted_vals[min(len(sorted_vals) - 1, int(q * len(sorted_vals)))]
+
+
+class SourceMetrics:
+    def __init__(self):
+        self.requests = 0
+        self.bytes = 0
+        self.retries = 0
+        self.errors = 0
+        self.cache = Counter()
+        self.latencies = []
+        self.slowest = []  # (초, url) 최소 힙
+        self.seconds = None
+        self.rows = None
+
+    def to_dict(self) -> dict:
+        lat = sorted(self.latencies)
+        return {
+            "seconds": None if self.seconds is None else round(self.seconds, 3),
+            "rows": self.rows,
+            "requests": self.requests,
+            "bytes": self.bytes,
+            "retries": self.retries,
+            "errors": self.errors,
+            "cache": dict(sorted(self.cache.items())),
+            "fetchSeconds": round(sum(lat), 3),
+            "latencyMs": {k: round(percentile(lat, q) * 1000, 1) if lat else None
+                          for k, q in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99), ("max", 1.0))},
+            "slowest": [{"url": u, "ms": round(s * 1000, 1)} for s, u in sorted(self.slowest, reverse=True)],
+        }
+
+
+class BuildMetrics:
+    # 요청은 어느 스레드에서 오든 현재 소스(thread-local)에 기록한다.
+    # 소스 스레드가 만든 작업 스레드에는 source() 로 소스 이름을 넘겨준다.
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.sources = {}
+        self.stages = {}
+        self.started = time.perf_counter()
+
+    def current_source(self) -> str:
+        return getattr(self.local, "source", None)
+
+    @contextmanager
+    def source(self, name: str):
+        prev = self.current_source()
+        self.local.source = name
+        try:
+            yield
+        finally:
+            self.local.source = prev
+
+    def _get(self, name: str) -> SourceMetrics:
+        m = self.sources.get(name)
+        if m is None:
+            m = self.sources[name] = SourceMetrics()
+        return m
+
+    def record_request(self, url: str, seconds: float, nbytes: int, outcome: str, retries: int = 0) -> None:
+        # outcome: hit / revalidated / miss / error
+        with self.lock:
+            m = self._get(self.current_source() or "other")
+            m.requests += 1
+            m.bytes += nbytes
+            m.retries += retries
+            m.errors += outcome == "error"
+            m.cache[outcome] += 1
+            m.latencies.append(seconds)
+            if len(m.slowest) < SLOWEST_KEEP:
+                heapq.heappush(m.slowest, (seconds, url))
+            elif seconds > m.slowest[0][0]:
+                heapq.heapreplace(m.slowest, (seconds, url))
+
+    def source_done(self, name: str, seconds: float, rows: int = None) -> None:
+        with self.lock:
+            m = self._get(name)
+            m.seconds = seconds
+            m.rows = rows
+
+    @contextmanager
+    def stage(self, name: str):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self.lock:
+                self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - t0
+
+    def to_dict(self) -> dict:
+        with self.lock:
+            return {
+                "totalSeconds": round(time.perf_counter() - self.started, 3),
+                "stages": {k: round(v, 3) for k, v in self.stages.items()},
+                "sources": {k: m.to_dict() for k, m in sorted(self.sources.items())},
+            }
+
+    def summary_lines(self) -> list:
+        d = self.to_dict()
+        lines = ["stages: " + " / ".join(f"{k} {v:.2f}s" for k, v in d["stages"].items())]
+        for name, m in d["sources"].items():
+            secs = "-" if m["seconds"] is None else f"{m['seconds']:.1f}s"
+            lines.append(
+                f"  {name}: {secs}, {m['requests']} req, {m['bytes'] / 1024:.0f} KiB, "
+                f"p50 {m['latencyMs']['p50']}ms p90 {m['latencyMs']['p90']}ms, "
+                f"retry {m['retries']}, error {m['errors']}, cache {m['cache']}"
+            )
+        return lines
+
+
+metrics = BuildMetrics()
+
+
+# Python 3.11 까지의 cProfile 은 켠 스레드만 잰다(sys.setprofile). 3.12 부터는 sys.monitoring 기반이라
+# 인터프리터 전체에 하나만 켤 수 있고(두 번째는 ValueError) 대신 그 하나가 모든 스레드의 이벤트를 받는다.
+PER_THREAD_PROFILE = sys.version_info < (3, 12)
+
+
+class BuildProfiler:
+    # 메인 스레드에서 cProfile 을 켜고, 3.11 이하에서는 threading.setprofile 로 이후 생기는 스레드마다 따로 켠다.
+    # 따로 스택 샘플러 스레드가 모든 스레드의 호출 스택을 주기적으로 모아 folded 형식으로 남긴다
+    # (flamegraph.pl / speedscope / inferno 에 바로 넣을 수 있다).
+    # 스레드별 프로파일러는 그 스레드만 끌 수 있으므로, 끝날 때 살아 있는 작업 스레드(타임아웃된 소스 등)의
+    # 기록은 dump 시점까지의 스냅숏이다.
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.main = None
+        self.profiles = []
+        self.stacks = Counter()
+        self.stop = threading.Event()
+        self.sampler = None
+
+    def _start_thread(self, *_):
+        p = cProfile.Profile()
+        with self.lock:
+            self.profiles.append(p)
+        p.enable()
+
+    def _sample(self):
+        me = threading.get_ident()
+        while not self.stop.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == me:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({code.co_filename.rsplit('/', 1)[-1]}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                stack.append(names.get(ident, str(ident)))
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def __enter__(self):
+        self.sampler = threading.Thread(target=self._sample, name="profile-sampler", daemon=True)
+        self.sampler.start()
+        if PER_THREAD_PROFILE:
+            threading.setprofile(self._start_thread)
+        self._start_thread()
+        self.main = self.profiles[0]
+        return self
+
+    def __exit__(self, *exc):
+        if PER_THREAD_PROFILE:
+            threading.setprofile(None)
+        self.main.disable()
+        self.stop.set()
+        self.sampler.join()
+
+    def dump(self, prefix: str) -> list:
+        """<prefix>.prof(pstats, 모든 스레드 합산)와 <prefix>.folded(스택 샘플)를 쓰고 경로 목록을 돌려준다."""
+        stats = None
+        for p in self.profiles:
+            p.create_stats()
+            if not p.stats:  # 아무것도 안 한 스레드
+                continue
+            if stats is None:
+                stats = pstats.Stats(p)
+            else:
+                stats.add(p)
+        if stats is not None:
+            stats.dump_stats(f"{prefix}.prof")
+        with open(f"{prefix}.folded", "w", encoding="utf-8") as f:
+            for stack, n in sorted(self.stacks.items()):
+                f.write(f"{stack} {n}\n")
+        return [f"{prefix}.prof", f"{prefix}.folded"]
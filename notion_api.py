@@ -0,0 +1,197 @@
+"""노션 API 공용 클라이언트.
+- requests.Session 하나로 연결을 재사용(스레드 여러 개가 같이 써도 됨)
+- 모든 요청이 전역 토큰 버킷(초당 3회)을 거친다
+- 429/5xx 는 Retry-After(없으면 지수 백오프)만큼 쉬고 다시 시도, 그래도 실패하면 requests.HTTPError
+- start_cursor 페이지 넘김 도우미와 요청 수/재시도/소요 시간 카운터
+- 블록 삭제/페이지 보관·생성을 여러 스레드로 한꺼번에 처리하는 bulk 도우미(진행 상황 출력)"""
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+from requests.adapters import HTTPAdapter
+
+NOTION_TOKEN = os.environ.get("NOTION_TOKEN")
+NOTION_API = "https://api.notion.com/v1"
+NOTION_VERSION = "2022-06-28"
+
+REQUEST_TIMEOUT = 30
+MAX_RETRIES = 4
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 30.0
+RETRY_STATUS = {429, 500, 502, 503, 504}
+# 노션 API 평균 허용량(초당 3회)
+RATE_PER_SEC = 3.0
+RATE_BURST = 3
+POOL_SIZE = 8
+# bulk 작업 동시 실행 수. 속도 상한은 토큰 버킷이 정하고, 이 값은 응답 대기 시간을 겹치는 데만 쓴다
+BULK_WORKERS = 6
+
+
+class TokenBucket:
+    """초당 rate 개씩 채워지고 최대 burst 개까지 쌓이는 토큰. take() 는 토큰이 생길 때까지 기다린다."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.stamp = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self) -> float:
+        # 기다린 시간(초)을 돌려준다
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.stamp) * self.rate)
+                self.stamp = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+    def pause(self, seconds: float):
+        # 429 를 받으면 다른 스레드도 같이 쉬도록 토큰을 비운다
+        with self.lock:
+            self.tokens = min(self.tokens, -seconds * self.rate)
+
+
+def retry_after(res) -> float:
+    try:
+        return max(0.0, float(res.headers.get("Retry-After", "")))
+    except ValueError:
+        return None
+
+
+class NotionClient:
+    def __init__(self, token=None, rate=RATE_PER_SEC, burst=RATE_BURST):
+        self.session = requests.Session()
+        self.session.headers.update({
+            "Authorization": f"Bearer {token or NOTION_TOKEN}",
+            "Content-Type": "application/json",
+            "Notion-Version": NOTION_VERSION,
+        })
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE)
+        self.session.mount("https://", adapter)
+        self.bucket = TokenBucket(rate, burst)
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "retries": 0, "throttled": 0, "failed": 0, "seconds": 0.0, "waited": 0.0}
+        self.by_method = {}
+
+    def _count(self, method, elapsed, waited, **inc):
+        with self.lock:
+            self.stats["requests"] += 1
+            self.stats["seconds"] += elapsed
+            self.stats["waited"] += waited
+            for k, v in inc.items():
+                self.stats[k] += v
+            m = self.by_method.setdefault(method, {"count": 0, "seconds": 0.0})
+            m["count"] += 1
+            m["seconds"] += elapsed
+
+    def request(self, method, path, payload=None, params=None):
+        """path 는 "/pages" 처럼 API 기준 경로(또는 전체 URL). 응답 JSON 을 돌려준다."""
+        url = path if path.startswith("http") else NOTION_API + path
+        for attempt in range(MAX_RETRIES + 1):
+            waited = self.bucket.take()
+            t0 = time.perf_counter()
+            res = self.session.request(method, url, json=payload, params=params, timeout=REQUEST_TIMEOUT)
+            elapsed = time.perf_counter() - t0
+            if res.status_code in RETRY_STATUS and attempt < MAX_RETRIES:
+                delay = retry_after(res)
+                if delay is None:
+                    delay = min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)) * (0.5 + random.random() / 2)
+                self._count(method, elapsed, waited, retries=1, throttled=int(res.status_code == 429))
+                if res.status_code == 429:
+                    # 다음 take() 가 delay 만큼 기다리게 된다
+                    self.bucket.pause(delay)
+                else:
+                    time.sleep(delay)
+                continue
+            self._count(method, elapsed, waited, failed=int(res.status_code >= 400))
+            res.raise_for_status()
+            return res.json() if res.content else {}
+
+    def get(self, path, params=None):
+        return self.request("GET", path, params=params)
+
+    def post(self, path, payload=None):
+        return self.request("POST", path, payload)
+
+    def patch(self, path, payload=None):
+        return self.request("PATCH", path, payload)
+
+    def delete(self, path):
+        return self.request("DELETE", path)
+
+    def iter_children(self, block_id, page_size=100):
+        """블록의 자식을 start_cursor 로 끝까지 넘기며 돌려준다."""
+        params = {"page_size": page_size}
+        while True:
+            data = self.get(f"/blocks/{block_id}/children", params)
+            yield from data.get("results", [])
+            if not data.get("has_more"):
+                return
+            params["start_cursor"] = data.get("next_cursor")
+
+    def iter_query(self, database_id, payload=None, page_size=100):
+        """데이터베이스 조회 결과를 start_cursor 로 끝까지 넘기며 돌려준다."""
+        payload = dict(payload or {}, page_size=page_size)
+        while True:
+            data = self.post(f"/databases/{database_id}/query", payload)
+            yield from data.get("results", [])
+            if not data.get("has_more"):
+                return
+            payload["start_cursor"] = data.get("next_cursor")
+
+    def bulk(self, fn, items, label="bulk", workers=BULK_WORKERS, report_every=0.1):
+        """items 각각에 fn(item) 을 동시에 실행한다. 진행률을 report_every(비율) 단위로 출력하고
+        (성공 결과 목록, [(item, 예외)] 실패 목록)을 입력 순서대로 돌려준다."""
+        items = list(items)
+        total = len(items)
+        results = [None] * total
+        failed = set()
+        failures = []
+        if not total:
+            return [], []
+        step = max(1, int(total * report_every))
+        started = time.perf_counter()
+        done = 0
+        with ThreadPoolExecutor(max_workers=min(workers, total)) as ex:
+            futs = {ex.submit(fn, item): i for i, item in enumerate(items)}
+            for fut in as_completed(futs):
+                i = futs[fut]
+                try:
+                    results[i] = fut.result()
+                except requests.RequestException as e:
+                    failed.add(i)
+                    failures.append((items[i], e))
+                done += 1
+                if done % step == 0 or done == total:
+                    elapsed = time.perf_counter() - started
+                    print(f"  {label}: {done}/{total} ({done / elapsed if elapsed else 0:.1f}/s, 실패 {len(failures)})")
+        return [r for i, r in enumerate(results) if i not in failed], failures
+
+    def delete_blocks(self, block_ids, label="delete"):
+        return self.bulk(lambda bid: self.delete(f"/blocks/{bid}"), block_ids, label)
+
+    def archive_pages(self, page_ids, label="archive"):
+        return self.bulk(lambda pid: self.patch(f"/pages/{pid}", {"archived": True}), page_ids, label)
+
+    def create_pages(self, payloads, label="create"):
+        return self.bulk(lambda payload: self.post("/pages", payload), payloads, label)
+
+    def summary(self) -> str:
+        s = self.stats
+        per = " ".join(f"{m} {v['count']}" for m, v in sorted(self.by_method.items()))
+        avg = s["seconds"] / s["requests"] * 1000 if s["requests"] else 0
+        return (f"notion api: {s['requests']} req ({per}) / retry {s['retries']} (429 {s['throttled']}) / "
+                f"failed {s['failed']} / avg {avg:.0f}ms / rate-wait {s['waited']:.1f}s")
+
+
+notion = NotionClient()
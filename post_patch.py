@@ -4,18 +4,12 @@ import sys
 import os
 from datetime import datetime
 
+from notion_api import notion
+
 # 설정
-NOTION_TOKEN = "os.environ.get("NOTION_TOKEN")"
 DATABASE_ID = "3129979fd60d81cc8e99cb28f8f8c5e1"
 
 def post_patch_note(title, category, version, content=""):
-    url = "https://api.notion.com/v1/pages"
-    headers = {
-        "Authorization": f"Bearer {NOTION_TOKEN}",
-        "Content-Type": "application/json",
-        "Notion-Version": "2022-06-28"
-    }
-    
     # 노션 데이터베이스 구조에 맞춘 데이터
     data = {
         "parent": { "database_id": DATABASE_ID },
@@ -55,14 +49,15 @@ def post_patch_note(title, category, version, content=""):
             }
         ]
 
-    response = requests.post(url, headers=headers, json=data)
-    
-    if response.status_code == 200:
-        print(f"✅ DocsHunt AI 패치노트 등록 성공: {title} ({version})")
-        print(f"🔗 링크: https://www.notion.so/{response.json().get('id').replace('-', '')}")
-    else:
-        print(f"❌ 등록 실패 (상태 코드: {response.status_code})")
-        print(response.text)
+    try:
+        page = notion.post("/pages", data)
+    except requests.HTTPError as e:
+        print(f"❌ 등록 실패 (상태 코드: {e.response.status_code})")
+        print(e.response.text)
+        return
+
+    print(f"✅ DocsHunt AI 패치노트 등록 성공: {title} ({version})")
+    print(f"🔗 링크: https://www.notion.so/{page.get('id').replace('-', '')}")
 
 if __name__ == "__main__":
     if len(sys.argv) < 4:
@@ -5,9 +5,9 @@ cd "$(dirname "$0")/.."
 
 MSG=${1:-"chore: data refresh"}
 
-python3 build_notices.py
+python3 build_notices.py --compact
 
-git add notices.json notices.js
+git add notices.json notices.js notices-delta.json data
 
 if git diff --cached --quiet; then
   echo "No data changes to commit."
@@ -1,33 +1,19 @@
-import requests
 import json
-import time
 from datetime import datetime
 
-NOTION_TOKEN = "os.environ.get("NOTION_TOKEN")"
+from notion_api import notion
+
 PAGE_ID = "3129979fd60d80b4b97bd7ad44e2189d"
 DATABASE_ID = "3129979fd60d81cc8e99cb28f8f8c5e1"
 
-headers = {
-    "Authorization": f"Bearer {NOTION_TOKEN}",
-    "Content-Type": "application/json",
-    "Notion-Version": "2022-06-28"
-}
-
 def clean_page():
-    url = f"https://api.notion.com/v1/blocks/{PAGE_ID}/children"
-    res = requests.get(url, headers=headers)
-    if res.status_code == 200:
-        blocks = res.json().get("results", [])
-        for block in blocks:
-            # 신규 데이터베이스는 유지 (child_database 타입 체크)
-            if block['type'] == 'child_database':
-                continue
-            requests.delete(f"https://api.notion.com/v1/blocks/{block['id']}", headers=headers)
-            time.sleep(0.1)
-    print("🧹 페이지 청소 완료!")
+    # 지우는 동안 목록이 밀리지 않도록 먼저 끝까지 받아 둔다
+    # 신규 데이터베이스는 유지 (child_database 타입 체크)
+    targets = [block['id'] for block in notion.iter_children(PAGE_ID) if block['type'] != 'child_database']
+    deleted, failures = notion.delete_blocks(targets, "블록 삭제")
+    print(f"🧹 페이지 청소 완료! (삭제 {len(deleted)}건, 실패 {len(failures)}건)")
 
 def setup_dashboard():
-    url = f"https://api.notion.com/v1/blocks/{PAGE_ID}/children"
     desc = ("🚀 DocsHunt AI 공식 패치노트 관리 시스템\n"
             "이곳은 독스헌트 AI의 모든 업데이트 내역을 기록하고 관리하는 공간입니다. "
             "아래 데이터베이스에 기록된 내용은 서비스 내 '소식' 탭과 연동될 수 있습니다.")
@@ -63,12 +49,11 @@ def setup_dashboard():
             }
         ]
     }
-    requests.patch(url, headers=headers, json=data)
+    notion.patch(f"/blocks/{PAGE_ID}/children", data)
     print("✨ 대시보드 틀 구성 완료!")
 
 def add_example_patch():
     """실제 사용자가 복사해서 쓸만한 고품질 예시 데이터 추가"""
-    url = "https://api.notion.com/v1/pages"
     payload = {
         "parent": { "database_id": DATABASE_ID },
         "properties": {
@@ -93,10 +78,11 @@ def add_example_patch():
             }
         ]
     }
-    requests.post(url, headers=headers, json=payload)
+    notion.post("/pages", payload)
     print("📝 예시 패치노트 등록 완료!")
 
 if __name__ == "__main__":
     clean_page()
     setup_dashboard()
     add_example_patch()
+    print(notion.summary())
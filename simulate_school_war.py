@@ -1,5 +1,13 @@
 import random
 import time
+import argparse
+import heapq
+
+# numpy 가 있으면 VectorSimulation(도시 규모 시뮬레이션)을 쓸 수 있다
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # 1. 서울 지역 학교 및 거점 세팅
 SCHOOLS = [
@@ -14,37 +22,81 @@ SPOTS = [
     "CU 성수점", "GS25 대치점", "엽기떡볶이", "마라탕천국", "스타벅스", "코인노래방", "PC방", "명동교자", "이디야"
 ]
 
+USERS_PER_SCHOOL = 100
+ACTIVE_PER_TICK = 50     # 시간당 활동 유저 수
+CAPTURE_PROB = 0.3       # 탈환 확률
+REVENUE_PER_EVENT = 150  # 광고 수익 150원 (전면 광고+배너 합산 가정)
+CAPTURE_POWER = 200
+CAPTURE_CONTRIBUTION = 50
+
+
+def make_city(n_schools, n_spots):
+    """도시 규모 시뮬레이션용 가상 학교/거점 목록"""
+    schools = [{"name": f"학교{i:04d}", "region": f"구{i % 25:02d}"} for i in range(n_schools)]
+    spots = [f"거점{i:05d}" for i in range(n_spots)]
+    return schools, spots
+
+
 class Simulation:
-    def __init__(self):
+    def __init__(self, seed=None, active_per_tick=ACTIVE_PER_TICK, capture_prob=CAPTURE_PROB,
+                 revenue_per_event=REVENUE_PER_EVENT):
+        # seed 가 같으면 결과도 같다(전역 random 과 분리)
+        self.rng = random.Random(seed)
+        self.active_per_tick = active_per_tick
+        self.capture_prob = capture_prob
+        self.revenue_per_event = revenue_per_event
         self.users = []
-        self.spots_status = {spot: random.choice(SCHOOLS)["name"] for spot in SPOTS}
+        self.spots_status = {spot: self.rng.choice(SCHOOLS)["name"] for spot in SPOTS}
         self.prize_pools = {s["name"]: 0 for s in SCHOOLS}
         self.logs = []
         
         for school in SCHOOLS:
-            for i in range(100): # 학교당 100명
+            for i in range(USERS_PER_SCHOOL): # 학교당 100명
                 self.users.append({
                     "id": f"{school['name']}_학생_{i}",
                     "school": school["name"],
-                    "power": random.randint(500, 2000),
+                    "power": self.rng.randint(500, 2000),
                     "contribution": 0
                 })
 
+        # 실시간 순위표: 학교별 점유 거점 수와 전투력 최대 힙을 탈환 때마다 갱신한다
+        # 힙 항목은 (-전투력, 유저 번호). 전투력은 오르기만 하므로 값이 달라진 항목은 꺼낼 때 버린다
+        self.spot_counts = {s["name"]: 0 for s in SCHOOLS}
+        for owner in self.spots_status.values():
+            self.spot_counts[owner] += 1
+        self.members = {s["name"]: [] for s in SCHOOLS}
+        for i, u in enumerate(self.users):
+            self.members[u["school"]].append(i)
+        self.power_heaps = {name: self._build_heap(name) for name in self.members}
+
+    def _build_heap(self, school_name):
+        heap = [(-self.users[i]["power"], i) for i in self.members[school_name]]
+        heapq.heapify(heap)
+        return heap
+
     def run_tick(self, hour):
         event_count = 0
-        revenue_per_event = 150 # 광고 수익 150원 (전면 광고+배너 합산 가정)
+        revenue_per_event = self.revenue_per_event
         
         # 시간당 유저 활동 (랜덤하게 50명 추출)
-        active_users = random.sample(self.users, 50)
-        for user in active_users:
-            target_spot = random.choice(SPOTS)
+        active = self.rng.sample(range(len(self.users)), min(self.active_per_tick, len(self.users)))
+        for i in active:
+            user = self.users[i]
+            target_spot = self.rng.choice(SPOTS)
             current_owner = self.spots_status[target_spot]
             
             if current_owner != user["school"]:
-                if random.random() < 0.3: # 30% 확률로 탈환
+                if self.rng.random() < self.capture_prob: # 30% 확률로 탈환
                     self.spots_status[target_spot] = user["school"]
-                    user["power"] += 200
-                    user["contribution"] += 50
+                    self.spot_counts[current_owner] -= 1
+                    self.spot_counts[user["school"]] += 1
+                    user["power"] += CAPTURE_POWER
+                    user["contribution"] += CAPTURE_CONTRIBUTION
+                    heap = self.power_heaps[user["school"]]
+                    heapq.heappush(heap, (-user["power"], i))
+                    # 묵은 항목이 학생 수만큼 쌓이면 다시 만든다(탈환당 상수 시간으로 상각)
+                    if len(heap) > 2 * len(self.members[user["school"]]):
+                        self.power_heaps[user["school"]] = self._build_heap(user["school"])
                     event_count += 1
             
             # 활동마다 광고 수익 적립
@@ -52,24 +104,115 @@ class Simulation:
             
         return event_count
 
+    def king(self, school_name):
+        """학교에서 전투력이 가장 높은 유저(같으면 먼저 등록된 유저). 묵은 힙 항목을 버리며 상단만 본다."""
+        heap = self.power_heaps[school_name]
+        while -heap[0][0] != self.users[heap[0][1]]["power"]:
+            heapq.heappop(heap)
+        return self.users[heap[0][1]]
+
     def get_summary(self):
-        ranking = {}
-        for school in SCHOOLS:
-            held = list(self.spots_status.values()).count(school["name"])
-            ranking[school["name"]] = held
-        kings = {}
-        for school in SCHOOLS:
-            school_users = [u for u in self.users if u["school"] == school["name"]]
-            king = max(school_users, key=lambda x: x["power"])
-            kings[school["name"]] = king
+        ranking = {school["name"]: self.spot_counts[school["name"]] for school in SCHOOLS}
+        kings = {school["name"]: self.king(school["name"]) for school in SCHOOLS}
         return {
             "ranking": sorted(ranking.items(), key=lambda x: x[1], reverse=True),
             "kings": kings,
             "prize_pools": self.prize_pools
         }
 
-def run_simulation():
-    sim = Simulation()
+
+class VectorSimulation:
+    """Simulation 과 같은 규칙을 numpy 배열로 돌리는 엔진.
+    유저는 (school, power, contribution) 배열, 거점 점유는 학교 인덱스 배열로 들고
+    한 시간(tick)의 추출/탈환 판정을 한 번에 뽑아 마스크로 반영한다. get_summary 결과 형식은 Simulation 과 같다."""
+
+    def __init__(self, schools=SCHOOLS, spots=SPOTS, users_per_school=USERS_PER_SCHOOL,
+                 active_per_tick=ACTIVE_PER_TICK, capture_prob=CAPTURE_PROB,
+                 revenue_per_event=REVENUE_PER_EVENT, seed=None):
+        if np is None:
+            raise RuntimeError("VectorSimulation 에는 numpy 가 필요합니다 (pip install numpy)")
+        self.schools = [s["name"] for s in schools]
+        self.spots = list(spots)
+        self.users_per_school = users_per_school
+        self.active_per_tick = active_per_tick
+        self.capture_prob = capture_prob
+        self.revenue_per_event = revenue_per_event
+        self.rng = np.random.default_rng(seed)
+
+        n_schools = len(self.schools)
+        # 학교 순서대로 users_per_school 명씩 (Simulation 의 유저 순서와 같다)
+        self.school = np.repeat(np.arange(n_schools, dtype=np.int32), users_per_school)
+        self.power = self.rng.integers(500, 2001, size=len(self.school), dtype=np.int64)
+        self.contribution = np.zeros(len(self.school), dtype=np.int64)
+        self.owner = self.rng.integers(0, n_schools, size=len(self.spots), dtype=np.int32)
+        self.prize = np.zeros(n_schools, dtype=np.int64)
+
+    def run_tick(self, hour):
+        n = min(self.active_per_tick, len(self.school))
+        active = self.rng.choice(len(self.school), size=n, replace=False)
+        targets = self.rng.integers(0, len(self.spots), size=n)
+        rolls = self.rng.random(n)
+        return self.apply_tick(active, targets, rolls)
+
+    def apply_tick(self, active, targets, rolls):
+        """active[k] 유저가 targets[k] 거점을 rolls[k] 로 공격하는 것을 k 순서대로 처리한 것과 같은 결과.
+        같은 거점에서 판정에 성공한(rolls < p) 공격만 순서대로 보면, 바로 앞 성공 판정(없으면 원래 주인)과
+        학교가 다를 때만 실제로 탈환된다."""
+        school = self.school[active]
+        self.prize += np.bincount(school, minlength=len(self.schools)) * self.revenue_per_event
+
+        hit = np.flatnonzero(rolls < self.capture_prob)
+        if not len(hit):
+            return 0
+        order = hit[np.argsort(targets[hit], kind="stable")]
+        spot = targets[order]
+        att = school[order]
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = spot[1:] != spot[:-1]
+        prev = np.empty_like(att)
+        prev[1:] = att[:-1]
+        prev[first] = self.owner[spot[first]]
+        won = att != prev
+
+        users = active[order[won]]
+        self.power[users] += CAPTURE_POWER
+        self.contribution[users] += CAPTURE_CONTRIBUTION
+        # 거점마다 마지막 성공 판정의 학교가 새 주인(won 이 없으면 이미 그 학교 소유)
+        last = np.ones(len(order), dtype=bool)
+        last[:-1] = spot[:-1] != spot[1:]
+        self.owner[spot[last]] = att[last]
+        return int(won.sum())
+
+    def run(self, ticks, start_hour=8):
+        events = 0
+        for t in range(ticks):
+            events += self.run_tick(start_hour + t)
+        return events
+
+    def get_summary(self):
+        held = np.bincount(self.owner, minlength=len(self.schools))
+        ranking = {name: int(held[i]) for i, name in enumerate(self.schools)}
+        # 학교별 전투력 최댓값(같으면 앞 번호) = 학교, -전투력, 인덱스 순 정렬의 각 학교 첫 원소
+        idx = np.lexsort((np.arange(len(self.school)), -self.power, self.school))
+        starts = np.flatnonzero(np.r_[True, self.school[idx][1:] != self.school[idx][:-1]])
+        kings = {}
+        for u in idx[starts]:
+            si = int(self.school[u])
+            name = self.schools[si]
+            kings[name] = {
+                "id": f"{name}_학생_{int(u) - si * self.users_per_school}",
+                "school": name,
+                "power": int(self.power[u]),
+                "contribution": int(self.contribution[u]),
+            }
+        return {
+            "ranking": sorted(ranking.items(), key=lambda x: x[1], reverse=True),
+            "kings": kings,
+            "prize_pools": {name: int(self.prize[i]) for i, name in enumerate(self.schools)},
+        }
+
+def run_simulation(engine="python", seed=None):
+    sim = Simulation(seed=seed) if engine == "python" else VectorSimulation(seed=seed)
     print("🚀 [서울 대첩] AI 24시간 초고속 시뮬레이션 가동 중...")
     
     for h in range(8, 23): # 08시 ~ 22시
@@ -94,5 +237,36 @@ def run_simulation():
     print("\n💡 AI 분석: 특정 학교의 왕이 상금을 독식하는 구조가 보이며,")
     print("학교 간 경쟁이 심해질수록 트래픽과 광고 수익이 기하급수적으로 폭증함.")
 
+def run_city(n_schools, n_spots, users_per_school, active_per_tick, days, seed=None):
+    """도시 규모(학교 수천, 학생 수십만) 시뮬레이션을 VectorSimulation 으로 돌리고 요약만 출력"""
+    schools, spots = make_city(n_schools, n_spots)
+    sim = VectorSimulation(schools, spots, users_per_school=users_per_school,
+                           active_per_tick=active_per_tick, seed=seed)
+    started = time.perf_counter()
+    events = 0
+    for _ in range(days):
+        events += sim.run(15)
+    elapsed = time.perf_counter() - started
+    result = sim.get_summary()
+    print(f"🏙️ 학교 {n_schools}곳 / 학생 {len(sim.school):,}명 / 거점 {n_spots}곳 / {days}일({days * 15}틱): "
+          f"탈환 {events:,}회, {elapsed:.2f}s")
+    for school_name, count in result["ranking"][:5]:
+        king = result["kings"][school_name]
+        print(f"  [{school_name}] 거점 {count}개 · 왕 {king['id']} ({king['power']:,}) · 상금 ₩ {result['prize_pools'][school_name]:,}")
+
+
 if __name__ == "__main__":
-    run_simulation()
+    ap = argparse.ArgumentParser(description="학교 대항 거점 점령 시뮬레이션")
+    ap.add_argument("--engine", choices=["python", "vector"], default="python", help="vector 는 numpy 엔진")
+    ap.add_argument("--seed", type=int, default=None)
+    ap.add_argument("--city", action="store_true", help="도시 규모 시뮬레이션(vector 엔진)")
+    ap.add_argument("--schools", type=int, default=1000)
+    ap.add_argument("--spots", type=int, default=5000)
+    ap.add_argument("--users-per-school", type=int, default=300)
+    ap.add_argument("--active", type=int, default=20000, help="틱당 활동 유저 수")
+    ap.add_argument("--days", type=int, default=28)
+    args = ap.parse_args()
+    if args.city:
+        run_city(args.schools, args.spots, args.users_per_school, args.active, args.days, args.seed)
+    else:
+        run_simulation(args.engine, args.seed)
@@ -0,0 +1,191 @@
+"""학교 대항전 몬테카를로 파라미터 스윕.
+
+탈환 확률 x 이벤트당 수익 x 틱당 활동 유저 조합마다 시드를 고정한 하루(15틱) 시뮬레이션을 여러 번 돌려
+상금 풀과 '왕'의 독식 정도 분포를 본다. 실행은 프로세스 풀에 묶음(chunk) 단위로 나눠 보내고,
+각 묶음은 실행 결과 대신 정수 히스토그램만 돌려준다. 합치는 연산이 정수 덧셈뿐이라
+워커 수나 완료 순서와 상관없이 같은 --seed 면 결과가 같다.
+
+    python3 sweep_school_war.py --runs 2000 --capture-prob 0.2,0.3,0.4 --revenue 100,150 --active 50,100
+"""
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import product
+
+import simulate_school_war as war
+
+TICKS_PER_DAY = 15
+CHUNK_RUNS = 50
+
+# 지표 이름 -> 히스토그램 칸 너비(값은 모두 정수, 비율은 만분율)
+METRICS = {
+    "totalPrize": 1000,        # 전체 상금 풀(원)
+    "topPrizeShareBp": 50,     # 1등 학교 상금 비중(만분율)
+    "topSpotShareBp": 100,     # 가장 많은 거점을 가진 학교의 점유율(만분율)
+    "kingPower": 50,           # 가장 센 왕의 전투력
+    "kingPowerLeadBp": 100,    # 1등 왕이 2등 왕보다 센 정도(만분율)
+    "captures": 5,             # 하루 탈환 횟수
+}
+
+
+class StreamingHistogram:
+    """고정 너비 칸의 정수 히스토그램. 합치기(merge)가 순서와 무관하고 분위수는 칸 안에서 선형 보간한다."""
+
+    def __init__(self, width):
+        self.width = width
+        self.bins = {}
+        self.n = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def add(self, v):
+        b = v // self.width
+        self.bins[b] = self.bins.get(b, 0) + 1
+        self.n += 1
+        self.total += v
+        self.min = v if self.min is None else min(self.min, v)
+        self.max = v if self.max is None else max(self.max, v)
+
+    def merge(self, other):
+        for b, c in other.bins.items():
+            self.bins[b] = self.bins.get(b, 0) + c
+        self.n += other.n
+        self.total += other.total
+        if other.n:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def quantile(self, q):
+        if not self.n:
+            return None
+        rank = q * (self.n - 1)
+        seen = 0
+        for b in sorted(self.bins):
+            c = self.bins[b]
+            if seen + c > rank:
+                lo = max(b * self.width, self.min)
+                hi = min((b + 1) * self.width, self.max)
+                return lo + (hi - lo) * ((rank - seen + 0.5) / c)
+            seen += c
+        return self.max
+
+    def to_dict(self, quantiles=(0.05, 0.25, 0.5, 0.75, 0.95)):
+        return {
+            "n": self.n,
+            "mean": self.total / self.n if self.n else None,
+            "min": self.min,
+            "max": self.max,
+            "quantiles": {f"p{round(q * 100)}": self.quantile(q) for q in quantiles},
+            "width": self.width,
+            "bins": {str(b * self.width): c for b, c in sorted(self.bins.items())},
+        }
+
+
+def run_seed(base_seed, combo_idx, run_idx):
+    # 실행마다 독립 시드 (워커 배치와 무관)
+    h = hashlib.blake2b(f"{base_seed}/{combo_idx}/{run_idx}".encode(), digest_size=8)
+    return int.from_bytes(h.digest(), "big")
+
+
+def run_metrics(engine, seed, capture_prob, revenue, active):
+    if engine == "vector":
+        sim = war.VectorSimulation(capture_prob=capture_prob, revenue_per_event=revenue,
+                                   active_per_tick=active, seed=seed)
+    else:
+        sim = war.Simulation(seed=seed, capture_prob=capture_prob, revenue_per_event=revenue,
+                             active_per_tick=active)
+    captures = 0
+    for h in range(8, 8 + TICKS_PER_DAY):
+        captures += sim.run_tick(h)
+    s = sim.get_summary()
+    prizes = sorted(s["prize_pools"].values(), reverse=True)
+    total = sum(prizes)
+    spots = sum(c for _, c in s["ranking"])
+    kings = sorted((k["power"] for k in s["kings"].values()), reverse=True)
+    lead = kings[0] - (kings[1] if len(kings) > 1 else 0)
+    return {
+        "totalPrize": total,
+        "topPrizeShareBp": prizes[0] * 10000 // total if total else 0,
+        "topSpotShareBp": s["ranking"][0][1] * 10000 // spots if spots else 0,
+        "kingPower": kings[0],
+        "kingPowerLeadBp": lead * 10000 // kings[0],
+        "captures": captures,
+    }
+
+
+def run_chunk(engine, base_seed, combo_idx, params, start, stop):
+    """한 조합의 [start, stop) 번째 실행을 돌리고 지표별 히스토그램만 돌려준다."""
+    hists = {m: StreamingHistogram(w) for m, w in METRICS.items()}
+    for r in range(start, stop):
+        for m, v in run_metrics(engine, run_seed(base_seed, combo_idx, r), *params).items():
+            hists[m].add(v)
+    return combo_idx, hists
+
+
+def parse_list(s, cast):
+    return [cast(x) for x in s.split(",") if x.strip()]
+
+
+def sweep(engine, combos, runs, seed, workers):
+    results = {i: {m: StreamingHistogram(w) for m, w in METRICS.items()} for i in range(len(combos))}
+    tasks = [(i, a, min(a + CHUNK_RUNS, runs)) for i in range(len(combos)) for a in range(0, runs, CHUNK_RUNS)]
+    done = 0
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        futs = [ex.submit(run_chunk, engine, seed, i, combos[i], a, b) for i, a, b in tasks]
+        for fut in as_completed(futs):
+            i, hists = fut.result()
+            for m, h in hists.items():
+                results[i][m].merge(h)
+            done += 1
+            if done % max(1, len(tasks) // 10) == 0 or done == len(tasks):
+                print(f"  {done}/{len(tasks)} chunks")
+    return results
+
+
+def main():
+    ap = argparse.ArgumentParser(description="학교 대항전 몬테카를로 파라미터 스윕")
+    ap.add_argument("--runs", type=int, default=1000, help="조합당 실행 횟수")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--capture-prob", default=str(war.CAPTURE_PROB), help="쉼표로 구분, 예: 0.2,0.3,0.4")
+    ap.add_argument("--revenue", default=str(war.REVENUE_PER_EVENT), help="이벤트당 수익(원), 쉼표로 구분")
+    ap.add_argument("--active", default=str(war.ACTIVE_PER_TICK), help="틱당 활동 유저 수, 쉼표로 구분")
+    ap.add_argument("--engine", choices=["auto", "python", "vector"], default="auto")
+    ap.add_argument("--workers", type=int, default=os.cpu_count())
+    ap.add_argument("--out", default="", help="결과 JSON 경로(히스토그램 포함)")
+    args = ap.parse_args()
+
+    engine = args.engine
+    if engine == "auto":
+        engine = "vector" if war.np is not None else "python"
+    combos = list(product(parse_list(args.capture_prob, float), parse_list(args.revenue, int), parse_list(args.active, int)))
+
+    print(f"🎲 {len(combos)}개 조합 x {args.runs}회 ({engine} 엔진, 워커 {args.workers}개, seed {args.seed})")
+    started = time.perf_counter()
+    results = sweep(engine, combos, args.runs, args.seed, args.workers)
+    elapsed = time.perf_counter() - started
+    print(f"완료: {len(combos) * args.runs:,}회, {elapsed:.1f}s")
+
+    report = []
+    for i, (p, rev, act) in enumerate(combos):
+        stats = {m: h.to_dict() for m, h in results[i].items()}
+        report.append({"captureProb": p, "revenuePerEvent": rev, "activePerTick": act, "metrics": stats})
+        q = {m: stats[m]["quantiles"] for m in stats}
+        print(f"\n[탈환 {p:.2f} / 수익 {rev}원 / 활동 {act}명]")
+        print(f"  상금 풀 p5/p50/p95: ₩ {q['totalPrize']['p5']:,.0f} / {q['totalPrize']['p50']:,.0f} / {q['totalPrize']['p95']:,.0f}")
+        print(f"  1등 학교 상금 비중 p50/p95: {q['topPrizeShareBp']['p50'] / 100:.1f}% / {q['topPrizeShareBp']['p95'] / 100:.1f}%")
+        print(f"  1등 학교 거점 점유 p50/p95: {q['topSpotShareBp']['p50'] / 100:.1f}% / {q['topSpotShareBp']['p95'] / 100:.1f}%")
+        print(f"  왕 전투력 p50/p95: {q['kingPower']['p50']:,.0f} / {q['kingPower']['p95']:,.0f} "
+              f"(2등 왕 대비 +{q['kingPowerLeadBp']['p50'] / 100:.1f}%)")
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump({"engine": engine, "runs": args.runs, "seed": args.seed, "results": report}, f, ensure_ascii=False, indent=1)
+        print(f"\n📄 {args.out}")
+
+
+if __name__ == "__main__":
+    main()
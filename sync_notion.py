@@ -1,75 +1,210 @@
 import json
 import requests
 import time
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from pathlib import Path
 
 import os
 
+from notion_api import NOTION_TOKEN, notion
+
 # 설정 (GitHub Secrets에 NOTION_TOKEN을 등록해야 합니다.)
-NOTION_TOKEN = os.environ.get("NOTION_TOKEN")
 PAGE_ID = os.environ.get("NOTION_PAGE_ID", "3129979fd60d80b4b97bd7ad44e2189d")
 
-headers = {
-    "Authorization": f"Bearer {NOTION_TOKEN}",
-    "Content-Type": "application/json",
-    "Notion-Version": "2022-06-28"
-}
+# 공고 id -> 노션 페이지 id + 내용 해시 + 소스(+ 보관 여부). 해시가 바뀐 공고만 다시 보낸다.
+# 목록에서 빠져 보관한 페이지도 id 를 남겨 두었다가 공고가 돌아오면 보관을 풀어 다시 쓴다.
+STATE_PATH = Path(os.environ.get("NOTION_SYNC_STATE", Path(__file__).resolve().parent / "notion_sync_state.json"))
+
+# 동시 작업 수(요청 속도는 notion_api 의 토큰 버킷이 맞춘다)
+SYNC_WORKERS = 4
+
 
 def get_existing_pages():
-    """이미 등록된 페이지 제목들을 가져와 중복 방지"""
-    url = f"https://api.notion.com/v1/blocks/{PAGE_ID}/children"
+    """이미 등록된 하위 페이지(제목 -> 페이지 id). 상태 파일이 없을 때 기존 페이지를 이어받는 데 쓴다."""
+    existing = {}
     try:
-        response = requests.get(url, headers=headers)
-        if response.status_code != 200: return set()
-        
-        results = response.json().get("results", [])
-        existing_titles = set()
-        for block in results:
+        for block in notion.iter_children(PAGE_ID):
             if block['type'] == 'child_page':
-                existing_titles.add(block['child_page']['title'])
-        return existing_titles
-    except:
-        return set()
+                existing.setdefault(block['child_page']['title'], block['id'])
+    except requests.RequestException as e:
+        print(f"⚠️ 기존 페이지 조회 실패: {e}")
+    return existing
+
+
+def load_state():
+    try:
+        state = json.loads(STATE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    # 다른 부모 페이지로 옮겼으면 처음부터
+    if state.get("pageId") != PAGE_ID:
+        return {}
+    return state.get("pages", {})
+
+
+def save_state(pages):
+    tmp = STATE_PATH.with_suffix(".tmp")
+    tmp.write_text(json.dumps({
+        "pageId": PAGE_ID,
+        "syncedAt": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "pages": dict(sorted(pages.items())),
+    }, ensure_ascii=False, indent=1) + "\n", encoding="utf-8")
+    tmp.replace(STATE_PATH)
+
+
+def page_title(n):
+    return f"[{n['source']}] {n['title']}"
+
+
+def page_body(n):
+    return [{ "type": "text", "text": { "content": f"공고일: {n.get('regDate', '-')}\n마감일: {n.get('deadline', '-')}\n링크: {n['url']}" } }]
+
+
+def page_hash(n):
+    # 노션에 실제로 보내는 내용만 해시한다
+    body = [page_title(n), page_body(n)]
+    return hashlib.sha1(json.dumps(body, ensure_ascii=False).encode("utf-8")).hexdigest()[:16]
+
+
+def create_page(n):
+    payload = {
+        "parent": { "page_id": PAGE_ID },
+        "properties": {
+            "title": [ { "text": { "content": page_title(n) } } ]
+        },
+        "children": [
+            {
+                "object": "block",
+                "type": "paragraph",
+                "paragraph": { "rich_text": page_body(n) }
+            }
+        ]
+    }
+    return notion.post("/pages", payload)["id"]
+
+
+def update_page(page_id, n):
+    notion.patch(f"/pages/{page_id}", {
+        "properties": { "title": [ { "text": { "content": page_title(n) } } ] }
+    })
+    # 본문은 첫 번째 문단 블록을 고친다(없으면 붙인다)
+    for block in notion.iter_children(page_id):
+        if block["type"] == "paragraph":
+            notion.patch(f"/blocks/{block['id']}", { "paragraph": { "rich_text": page_body(n) } })
+            return
+    notion.patch(f"/blocks/{page_id}/children", {
+        "children": [{ "object": "block", "type": "paragraph", "paragraph": { "rich_text": page_body(n) } }]
+    })
+
+
+def restore_page(page_id):
+    notion.patch(f"/pages/{page_id}", { "archived": False })
+
+
+def failed_sources(data):
+    # errors 항목은 "소스: 메시지" 형식
+    return {e.split(":", 1)[0].strip() for e in data.get("errors") or []}
+
 
 def sync():
+    if not NOTION_TOKEN:
+        print("NOTION_TOKEN 이 없어 노션 동기화를 건너뜁니다.")
+        return
+
     with open("notices.json", "r", encoding="utf-8") as f:
         data = json.load(f)
-    
-    notices = data.get("notices", [])[:10] # 일단 상위 10개만 테스트
-    existing_titles = get_existing_pages()
-    
-    print(f"🔄 노션 동기화 시작: {PAGE_ID}")
-    
-    success_count = 0
+
+    notices = [n for n in data.get("notices", []) if n.get("id")]
+    failed = failed_sources(data)
+    pages = load_state()
+
+    print(f"🔄 노션 동기화 시작: {PAGE_ID} (공고 {len(notices)}건, 기록 {len(pages)}건)")
+
+    # 상태 파일이 없으면 제목이 같은 기존 페이지를 이어받아 중복 생성을 막는다
+    if not pages:
+        existing = get_existing_pages()
+        for n in notices:
+            pid = existing.get(page_title(n))
+            if pid:
+                pages[n["id"]] = {"page": pid, "hash": page_hash(n), "source": n.get("source")}
+
+    jobs = []
+    current = set()
     for n in notices:
-        title = f"[{n['source']}] {n['title']}"
-        if title in existing_titles:
+        current.add(n["id"])
+        h = page_hash(n)
+        old = pages.get(n["id"])
+        if not old:
+            jobs.append(("create", n, h))
+        elif old.get("archived"):
+            jobs.append(("restore", n, h))
+        elif old.get("hash") != h:
+            jobs.append(("update", n, h))
+        else:
+            # 소스가 없는 예전 기록은 API 호출 없이 채운다
+            old["source"] = n.get("source")
+    kept = 0
+    to_archive = []
+    for nid, old in pages.items():
+        if nid in current or old.get("archived"):
+            continue
+        # 이번 빌드에서 실패/타임아웃된 소스의 공고는 빠진 게 아니라 못 받은 것이라 그대로 둔다
+        # (소스를 모르는 예전 기록은 실패한 소스가 하나라도 있으면 보관하지 않는다)
+        if old.get("source") in failed or (failed and not old.get("source")):
+            kept += 1
             continue
-            
-        payload = {
-            "parent": { "page_id": PAGE_ID },
-            "properties": {
-                "title": [ { "text": { "content": title } } ]
-            },
-            "children": [
-                {
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": [{ "type": "text", "text": { "content": f"공고일: {n.get('regDate', '-')}\n마감일: {n.get('deadline', '-')}\n링크: {n['url']}" } }]
-                    }
-                }
-            ]
-        }
-
-        res = requests.post("https://api.notion.com/v1/pages", headers=headers, json=payload)
-        if res.status_code == 200:
-            success_count += 1
-            print(f"✅ 등록: {title}")
-        
-        time.sleep(0.5)
-
-    print(f"🎉 완료! 새롭게 등록된 공고: {success_count}건")
+        to_archive.append(nid)
+
+    def work(job):
+        kind, n, h = job
+        entry = {"page": None, "hash": h, "source": n.get("source")}
+        if kind == "create":
+            entry["page"] = create_page(n)
+            return kind, n["id"], entry
+        old = pages[n["id"]]
+        entry["page"] = old["page"]
+        if kind == "restore":
+            restore_page(old["page"])
+        if old.get("hash") != h:
+            update_page(old["page"], n)
+        return kind, n["id"], entry
+
+    unchanged = len(notices) - len(jobs)
+    counts = {"create": 0, "update": 0, "restore": 0, "archive": 0, "failed": 0}
+    started = time.time()
+    try:
+        with ThreadPoolExecutor(max_workers=SYNC_WORKERS) as ex:
+            futs = {ex.submit(work, job): job for job in jobs}
+            for fut in as_completed(futs):
+                try:
+                    kind, nid, entry = fut.result()
+                except requests.RequestException as e:
+                    counts["failed"] += 1
+                    kind, n, _ = futs[fut]
+                    print(f"❌ {kind} 실패: {page_title(n)} ({e})")
+                    continue
+                counts[kind] += 1
+                pages[nid] = entry
+        # 목록에서 빠진 공고의 페이지는 bulk 도우미로 한꺼번에 보관한다
+        _, failures = notion.archive_pages([pages[nid]["page"] for nid in to_archive], "보관")
+        bad = {pid: e for pid, e in failures}
+        for nid in to_archive:
+            pid = pages[nid]["page"]
+            if pid in bad:
+                counts["failed"] += 1
+                print(f"❌ archive 실패: {nid} ({bad[pid]})")
+            else:
+                counts["archive"] += 1
+                pages[nid] = {**pages[nid], "archived": True}
+    finally:
+        # 중간에 멈춰도 끝난 작업은 기록해 둔다
+        save_state(pages)
+
+    print(f"🎉 완료! 생성 {counts['create']} / 수정 {counts['update']} / 복원 {counts['restore']} / 보관 {counts['archive']} / "
+          f"실패 {counts['failed']} (변경 없음 {unchanged}건, 실패 소스라 보관 보류 {kept}건, {time.time() - started:.1f}s)")
+    print(notion.summary())
 
 if __name__ == "__main__":
     sync()
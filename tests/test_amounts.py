@@ -0,0 +1,32 @@
+# AmountExtractor(지원금 추출) 사례
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import build_notices as bn  # noqa: E402
+
+
+@pytest.mark.parametrize("text, krw, up_to", [
+    ("지원금 5천만원을 지원합니다", 50_000_000, False),
+    ("지원규모 기업당 최대 1억 5천만원 (총 사업비의 70% 이내)", 150_000_000, True),
+    ("최대 지원금 2억원", 200_000_000, True),
+    ("지원금 1억2천만원 이내로 지원", 120_000_000, True),
+    ("총 사업비 3억원", 300_000_000, True),
+    ("총사업비 3억원 규모", 300_000_000, True),
+    ("사업비 3억원", 300_000_000, False),
+    ("3개 기업 선정, 지원금 5천만원", 50_000_000, False),
+    ("지원한도 3천만원", 30_000_000, True),
+    ("기업당 최대 7천만원 지원", 70_000_000, True),
+])
+def test_extract(text, krw, up_to):
+    amount = bn.AMOUNTS.extract(text)
+    assert amount["krw"] == krw
+    assert amount["upTo"] is up_to
+
+
+def test_streaming_waits_for_window_after_amount():
+    # 금액 뒤 "이내" 가 아직 안 왔을 수 있으면 확정하지 않는다
+    assert bn.keyword_amount("지원금 1억원 이", complete=False) == ""
+    assert bn.keyword_amount("지원금 1억원" + " 내용" * 30, complete=False) == "지원금 1억원"
@@ -0,0 +1,121 @@
+# support_notice.html 의 데이터 로딩 경로(loadData -> fetchJSON/fetchShard -> decodeColumnar)를
+# build_notices.write_outputs 가 실제로 쓴 data/ 로 node 에서 돌려 본다. node 가 없으면 건너뛴다.
+import json, re, shutil, subprocess, sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+import build_notices as bn  # noqa: E402
+
+PAGE_FUNCS = ("setRaw", "intersectSorted", "ownList", "searchIdSet", "decodeColumnar", "fetchJSON", "fetchShard", "loadData")
+
+pytestmark = pytest.mark.skipif(shutil.which("node") is None, reason="node 가 필요함")
+
+
+def page_function(src: str, name: str) -> str:
+    # 함수 선언부터 짝이 맞는 닫는 중괄호까지(문자열 안의 중괄호는 건너뜀)
+    m = re.search(r"(?:async\s+)?function\s+" + name + r"\s*\(", src)
+    i = src.index("{", m.end())
+    depth = 0
+    quote = None
+    while True:
+        c = src[i]
+        if quote:
+            if c == "\\":
+                i += 1
+            elif c == quote:
+                quote = None
+        elif c in "'\"`":
+            quote = c
+        elif c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth == 0:
+                return src[m.start():i + 1]
+        i += 1
+
+
+def sample_notices() -> list:
+    out = []
+    for i, (src, dday) in enumerate([("kstartup", 2), ("kstartup", 20), ("bizinfo", 5), ("bizinfo", None), ("iris", 90), ("iris", -1)]):
+        key = f"{1000 + i}"
+        out.append({
+            "id": f"{src[0]}-{key}",
+            "source": src,
+            "title": f"2026년 테스트 지원사업 {i}차 공고",
+            "category": "사업화",
+            "deadline": "" if dday is None else f"2026-03-{10 + i:02d}",
+            "dday": dday,
+            "url": f"https://example.go.kr/{src}/view?id={key}",
+        })
+    return out
+
+
+def run_page(data_dir: Path, script: str) -> dict:
+    src = (ROOT / "support_notice.html").read_text(encoding="utf-8")
+    funcs = "\n".join(page_function(src, f) for f in PAGE_FUNCS)
+    harness = f"""
+const fs = require('fs');
+const DATA = {json.dumps(str(data_dir))} + '/';
+let RAW=[], BY_ID=new Map(), SEARCH=null, FEATURES=null, SHARD_FORMAT='rows', fellBack=false;
+const DATA_DIR='./data/';
+function fetch(url){{
+  const p = DATA + url.slice(DATA_DIR.length);
+  return Promise.resolve(fs.existsSync(p)
+    ? {{ok:true, status:200, json:()=>Promise.resolve(JSON.parse(fs.readFileSync(p,'utf8')))}}
+    : {{ok:false, status:404}});
+}}
+function showMeta(){{}}
+function render(){{}}
+function initData(){{}}
+const document = {{createElement(){{ fellBack=true; return {{}}; }}, head:{{appendChild(){{}}}}}};
+{funcs}
+(async()=>{{ {script} }})();
+"""
+    r = subprocess.run(["node", "-e", harness], capture_output=True, text=True, timeout=60)
+    assert r.returncode == 0, r.stderr
+    return json.loads(r.stdout)
+
+
+@pytest.mark.parametrize("compact", [True, False])
+def test_load_data_uses_shards(tmp_path, monkeypatch, compact):
+    monkeypatch.setattr(bn, "BASE", tmp_path)
+    monkeypatch.setattr(bn, "DATA_DIR", tmp_path / "data")
+    notices = sample_notices()
+    index = bn.write_outputs({"updatedAt": "2026-03-02 10:00:00", "count": len(notices)}, notices, compact=compact)
+    assert index["shardFormat"] == ("columnar" if compact else "rows")
+
+    out = run_page(tmp_path / "data", """
+      await loadData();
+      console.log(JSON.stringify({fellBack, format: SHARD_FORMAT, search: !!SEARCH,
+        rows: RAW.map(n=>({id:n.id, url:n.url, source:n.source})).sort((a,b)=>a.id<b.id?-1:1)}));
+    """)
+    assert not out["fellBack"]
+    assert out["format"] == index["shardFormat"]
+    assert out["search"]
+    # 마감 지난 공고(deadline-expired)는 페이지가 받지 않는다
+    expected = sorted(({"id": n["id"], "url": n["url"], "source": n["source"]} for n in notices if (n["dday"] is None or n["dday"] >= 0)),
+                      key=lambda n: n["id"])
+    assert out["rows"] == expected
+
+
+def test_search_ignores_prototype_keys(tmp_path, monkeypatch):
+    monkeypatch.setattr(bn, "BASE", tmp_path)
+    monkeypatch.setattr(bn, "DATA_DIR", tmp_path / "data")
+    notices = sample_notices()
+    notices[0]["title"] = "constructor 교육 지원"
+    bn.write_outputs({"updatedAt": "2026-03-02 10:00:00", "count": len(notices)}, notices, compact=True)
+
+    out = run_page(tmp_path / "data", """
+      await loadData();
+      const q = s => { const r = searchIdSet(s); return r && [...r].sort(); };
+      console.log(JSON.stringify({constructor: q('constructor'), tostring: q('tostring'), proto: q('__proto__'), hit: q('지원사업')}));
+    """)
+    assert out["constructor"] == [notices[0]["id"]]
+    assert out["tostring"] == []
+    assert out["proto"] == []
+    # 검색 색인은 마감 지난 공고까지 담는다
+    assert out["hit"] == sorted(n["id"] for n in notices[1:])